@@ -5,6 +5,8 @@ import hashlib
 import logging
 from typing import List, Dict, Any
 
+from core.game.config import SafeLoader
+
 logger = logging.getLogger("BenchmarkConfig")
 
 class BenchmarkConfig:
@@ -32,7 +34,7 @@ class BenchmarkConfig:
 
         # Load the benchmark configuration
         with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+            self.config = yaml.load(f, Loader=SafeLoader)
 
         # Validate the configuration
         self._validate_config()
@@ -1,14 +1,12 @@
 # core/benchmark/multi_player_runner.py
 import os
-import yaml
 import json
 import logging
 import time
 import random
 from datetime import datetime
-from typing import List, Dict, Set, Tuple, Any
+from typing import List, Dict, Set, Tuple, Any, Optional
 import itertools
-import numpy as np
 
 # Import from core modules
 from core.benchmark.config import BenchmarkConfig
@@ -196,8 +194,10 @@ class MultiPlayerBenchmarkRunner:
                 'sessions_run': self.sessions_run
             }
 
+            # Serialize up front so the file is written in one call
+            state_json = json.dumps(state, indent=2)
             with open(self.state_path, 'w') as f:
-                json.dump(state, f, indent=2)
+                f.write(state_json)
 
             logger.info(f"Saved benchmark state after {self.sessions_run} sessions")
 
@@ -265,10 +265,12 @@ class MultiPlayerBenchmarkRunner:
                 diversity_scores[model] = len(self.opponent_matrix[model]) / (len(self.models) - 1)
 
         # Calculate a combined score that considers both diversity and game count
+        # The busiest model's game count is the same for every model, so find it once
+        max_game_count = max(1, max(self.game_counts.values()))
         combined_scores = {}
         for model in self.models:
             diversity_factor = diversity_scores[model]
-            game_count_factor = self.game_counts.get(model, 0) / max(1, max(self.game_counts.values()))
+            game_count_factor = self.game_counts.get(model, 0) / max_game_count
             combined_scores[model] = diversity_factor + game_count_factor
 
         # Select the anchor model with the lowest combined score
@@ -379,7 +381,10 @@ class MultiPlayerBenchmarkRunner:
             total_weight = sum(weights)
             probabilities = [w / total_weight for w in weights]
 
-            # Weighted random selection
+            # Weighted random selection; numpy is only needed here, so it is
+            # imported on first use rather than when the runner is loaded
+            import numpy as np
+
             selected = []
             remaining_models = filtered_models.copy()
             remaining_probs = probabilities.copy()
@@ -511,7 +516,7 @@ class MultiPlayerBenchmarkRunner:
         Run the benchmark for the specified number of sessions.
         """
         logger.info(f"Starting benchmark with {self.sessions - self.sessions_run} sessions remaining")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Run remaining sessions
         for i in range(self.sessions_run, self.sessions):
@@ -526,7 +531,7 @@ class MultiPlayerBenchmarkRunner:
             role_assignments, model_roles = self._assign_roles_to_models(selected_models)
 
             # Run the session
-            session_id, session_dir = self._run_session(selected_models, role_assignments, model_roles)
+            session_id, session_dir, results = self._run_session(selected_models, role_assignments, model_roles)
 
             # Update state
             self._update_state_after_session(selected_models, model_roles)
@@ -535,14 +540,14 @@ class MultiPlayerBenchmarkRunner:
             self._save_state()
 
             # Log the result
-            self._log_session_result(selected_models, model_roles, session_id, session_dir)
+            self._log_session_result(selected_models, model_roles, session_id, session_dir, results)
 
             # Update counter
             self.sessions_run += 1
 
 
         # Calculate benchmark stats
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.info(f"Benchmark complete. Ran {self.sessions_run} sessions in {elapsed_time:.2f} seconds")
 
     def _update_state_after_session(self, models: List[str], model_roles: Dict[str, List[str]]) -> None:
@@ -572,7 +577,7 @@ class MultiPlayerBenchmarkRunner:
                 self.role_counts[model][role] += 1
 
     def _run_session(self, models: List[str], role_assignments: Dict[str, Dict[str, str]],
-                    model_roles: Dict[str, List[str]]) -> Tuple[str, str]:
+                    model_roles: Dict[str, List[str]]) -> Tuple[str, str, Optional[Dict[str, Any]]]:
         """
         Run a single game session with the specified models and role assignments.
 
@@ -582,7 +587,7 @@ class MultiPlayerBenchmarkRunner:
             model_roles (Dict[str, List[str]]): Maps models to their assigned roles
 
         Returns:
-            tuple: (session_id, session_dir) of the completed session
+            tuple: (session_id, session_dir, results) of the completed session
         """
         # Create a modified game config with the specified models
         game_config = self.base_game_config.copy()
@@ -622,38 +627,24 @@ class MultiPlayerBenchmarkRunner:
                     'assignment_to': player_id
                 })
 
-        # Create a temp config file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_config_path = os.path.join(self.output_dir, f"temp_config_{timestamp}.yaml")
-
-        with open(temp_config_path, 'w') as f:
-            yaml.dump(game_config, f)
-
-        try:
-            # Initialize and run the game
-            engine = GameEngine(
-                temp_config_path,
-                base_output_dir=self.output_dir,
-                benchmark_config=self.benchmark_config
-            )
-            engine.run_game()
-
-            # Get the session ID and directory
-            session_id = engine.game_session.session_id
-            session_dir = engine.game_session.session_dir
+        # Initialize and run the game with the modified config directly
+        engine = GameEngine(
+            self.base_game_config_path,
+            base_output_dir=self.output_dir,
+            benchmark_config=self.benchmark_config,
+            config=game_config
+        )
+        engine.run_game()
 
-            # Clean up the temp config file
-            os.remove(temp_config_path)
+        # Get the session ID and directory
+        session_id = engine.game_session.session_id
+        session_dir = engine.game_session.session_dir
 
-            return session_id, session_dir
-        except Exception as e:
-            # Clean up the temp config file on error
-            if os.path.exists(temp_config_path):
-                os.remove(temp_config_path)
-            raise
+        return session_id, session_dir, engine.game_session.results
 
     def _log_session_result(self, models: List[str], model_roles: Dict[str, List[str]],
-                           session_id: str, session_dir: str) -> None:
+                           session_id: str, session_dir: str,
+                           results: Optional[Dict[str, Any]] = None) -> None:
         """
         Log the result of a session to the benchmark log.
 
@@ -662,18 +653,21 @@ class MultiPlayerBenchmarkRunner:
             model_roles (Dict[str, List[str]]): Roles assigned to each model
             session_id (str): Session ID of the completed game
             session_dir (str): Directory of the session
+            results (dict, optional): Game results already in memory; read from the session directory if omitted
         """
-        # Find the game results file
-        results_path = os.path.join(session_dir, "results.json")
+        if results is None:
+            # Find the game results file
+            results_path = os.path.join(session_dir, "results.json")
 
-        if not os.path.exists(results_path):
-            logger.error(f"Results file not found: {results_path}")
-            return
+            if not os.path.exists(results_path):
+                logger.error(f"Results file not found: {results_path}")
+                return
 
         try:
-            # Load the game results
-            with open(results_path, 'r') as f:
-                results = json.load(f)
+            if results is None:
+                # Load the game results
+                with open(results_path, 'r') as f:
+                    results = json.load(f)
 
             # Build player results
             player_results = []
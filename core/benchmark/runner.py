@@ -1,6 +1,5 @@
 # core/benchmark/runner.py
 import os
-import yaml
 import json
 import logging
 import time
@@ -187,7 +186,7 @@ class BenchmarkRunner:
         completed yet and logs the results.
         """
         logger.info(f"Starting benchmark with {len(self.matchups_to_run)} matchups to run")
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Create a copy since we'll be removing items as we go
         matchups = self.matchups_to_run.copy()
@@ -198,10 +197,10 @@ class BenchmarkRunner:
 
             try:
                 # Run the game and get results
-                session_id, session_dir = self._run_game(model1, model2, game_num)
+                session_id, session_dir, results = self._run_game(model1, model2, game_num)
 
                 # Log the result
-                self._log_matchup_result(model1, model2, game_num, session_id, session_dir)
+                self._log_matchup_result(model1, model2, game_num, session_id, session_dir, results)
 
                 # Update stats
                 self.games_run += 1
@@ -214,11 +213,11 @@ class BenchmarkRunner:
                 continue
 
         # Calculate benchmark stats
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
         logger.info(f"Benchmark complete. Ran {self.games_run} games in {elapsed_time:.2f} seconds")
         logger.info(f"Total completed matchups: {len(self.completed_matchups)}")
 
-    def _run_game(self, model1: str, model2: str, game_num: int) -> Tuple[str, str]:
+    def _run_game(self, model1: str, model2: str, game_num: int) -> Tuple[str, str, Optional[Dict[str, Any]]]:
         """
         Run a single game with the specified models.
 
@@ -228,7 +227,7 @@ class BenchmarkRunner:
             game_num (int): Game number for this pair
 
         Returns:
-            tuple: (session_id, session_dir) of the completed game
+            tuple: (session_id, session_dir, results) of the completed game
         """
         # Create a modified game config with the specified models
         game_config = self.base_game_config.copy()
@@ -244,37 +243,23 @@ class BenchmarkRunner:
         game_config['llm_integration']['player_models']['player_1'] = model1
         game_config['llm_integration']['player_models']['player_2'] = model2
 
-        # Create a temp config file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_config_path = os.path.join(self.output_dir, f"temp_config_{timestamp}.yaml")
+        # Initialize and run the game with the modified config directly
+        engine = GameEngine(
+            self.base_game_config_path,
+            base_output_dir=self.output_dir,
+            benchmark_config=self.benchmark_config,
+            config=game_config
+        )
+        engine.run_game()
 
-        with open(temp_config_path, 'w') as f:
-            yaml.dump(game_config, f)
+        # Get the session ID and directory
+        session_id = engine.game_session.session_id
+        session_dir = engine.game_session.session_dir
 
-        try:
-            # Initialize and run the game
-            engine = GameEngine(
-                temp_config_path, 
-                base_output_dir=self.output_dir,
-                benchmark_config=self.benchmark_config  # Pass the benchmark config
-            )
-            engine.run_game()
-
-            # Get the session ID and directory
-            session_id = engine.game_session.session_id
-            session_dir = engine.game_session.session_dir
-
-            # Clean up the temp config file
-            os.remove(temp_config_path)
-
-            return session_id, session_dir
-        except Exception as e:
-            # Clean up the temp config file on error
-            if os.path.exists(temp_config_path):
-                os.remove(temp_config_path)
-            raise
+        return session_id, session_dir, engine.game_session.results
 
-    def _log_matchup_result(self, model1: str, model2: str, game_num: int, session_id: str, session_dir: str) -> None:
+    def _log_matchup_result(self, model1: str, model2: str, game_num: int, session_id: str, session_dir: str,
+                            results: Optional[Dict[str, Any]] = None) -> None:
         """
         Log the result of a matchup to the benchmark log.
 
@@ -284,18 +269,21 @@ class BenchmarkRunner:
             game_num (int): Game number for this pair
             session_id (str): Session ID of the completed game
             session_dir (str): Directory of the session
+            results (dict, optional): Game results already in memory; read from the session directory if omitted
         """
-        # Find the game results file directly using the session directory
-        results_path = os.path.join(session_dir, "results.json")
+        if results is None:
+            # Find the game results file directly using the session directory
+            results_path = os.path.join(session_dir, "results.json")
 
-        if not os.path.exists(results_path):
-            logger.error(f"Results file not found: {results_path}")
-            return
+            if not os.path.exists(results_path):
+                logger.error(f"Results file not found: {results_path}")
+                return
 
         try:
-            # Load the game results
-            with open(results_path, 'r') as f:
-                results = json.load(f)
+            if results is None:
+                # Load the game results
+                with open(results_path, 'r') as f:
+                    results = json.load(f)
 
             # Create the log entry
             log_entry = {
@@ -1,11 +1,25 @@
 # utils/chat_logger.py
 import logging
 import json
+import threading
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger("chat_logger")
 
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_SETUP_LOCK = threading.Lock()
+
+
+def _configure_logger():
+    """Attach the console handler once, even if loggers are created concurrently."""
+    with _SETUP_LOCK:
+        logger.setLevel(logging.INFO)
+        if not logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setFormatter(_LOG_FORMATTER)
+            logger.addHandler(handler)
+
 class ChatLogger:
     """Logs chat history for all LLM interactions."""
 
@@ -22,11 +36,7 @@ class ChatLogger:
         self.consolidated_log_path = game_session.chat_logs_path
 
         # Set up logging
-        logger.setLevel(logging.INFO)
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-            logger.addHandler(handler)
+        _configure_logger()
 
     def log_interaction(self,
                        player_id: str,
@@ -62,7 +72,7 @@ class ChatLogger:
 
         # Save to the game session
         self.game_session.save_chat_log(log_entry)
-        logger.info(f"Logged interaction for player {player_id}")
+        logger.info("Logged interaction for player %s", player_id)
 
     def get_consolidated_log_path(self) -> str:
         """Get the path to the consolidated log file.
@@ -1,7 +1,51 @@
 # core/config.py
+import copy
+import functools
+import sys
 import yaml
 import os
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_yaml(text):
+    """
+    Parse YAML text, caching the result by content.
+
+    Callers must copy the returned object before modifying it.
+
+    Args:
+        text (str): The YAML document
+
+    Returns:
+        The parsed YAML document
+    """
+    return yaml.load(text, Loader=SafeLoader)
+
+def load_yaml_file(path):
+    """
+    Load a YAML file, reusing the parse of any identical document loaded before.
+
+    Args:
+        path (str): Path to the YAML file
+
+    Returns:
+        A private copy of the parsed YAML document
+    """
+    with open(path, 'r') as f:
+        return copy.deepcopy(_parse_yaml(f.read()))
+
+# Phase fields holding phase IDs, phase types or role names, which are compared
+# against each other on every phase transition and player lookup
+_INTERNED_PHASE_FIELDS = (
+    'id', 'type', 'next_phase', 'next_phase_success', 'next_phase_failure', 'eligible_role'
+)
+
 class ConfigLoader:
     """
     Loads and validates game configurations from YAML files.
@@ -30,7 +74,27 @@ class ConfigLoader:
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = _parse_yaml(f.read())
+
+        return ConfigLoader.from_dict(config)
+
+    @staticmethod
+    def from_dict(config):
+        """
+        Validate an already parsed game configuration.
+
+        The configuration is copied, so the caller's dict is never modified.
+
+        Args:
+            config (dict): The parsed configuration
+
+        Returns:
+            dict: The validated configuration with defaults applied
+
+        Raises:
+            ValueError: If the configuration is invalid or missing required keys
+        """
+        config = copy.deepcopy(config)
 
         # Validate required configuration sections
         ConfigLoader._validate_required_keys(config)
@@ -38,6 +102,8 @@ class ConfigLoader:
         # Apply defaults for optional sections
         ConfigLoader._apply_defaults(config)
 
+        ConfigLoader._intern_phase_names(config)
+
         return config
 
     @staticmethod
@@ -75,6 +141,23 @@ class ConfigLoader:
             if 'type' not in phase:
                 raise ValueError(f"Phase '{phase['id']}' missing required 'type' field")
 
+    @staticmethod
+    def _intern_phase_names(config):
+        """
+        Intern the phase IDs and role names used in phase configurations.
+
+        The same few names are compared many times per game, and interning
+        lets those comparisons and dict lookups short-circuit on identity.
+
+        Args:
+            config (dict): The configuration to update in place
+        """
+        for phase in config['phases']:
+            for field in _INTERNED_PHASE_FIELDS:
+                value = phase.get(field)
+                if isinstance(value, str):
+                    phase[field] = sys.intern(value)
+
     @staticmethod
     def _apply_defaults(config):
         """
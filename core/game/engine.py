@@ -26,16 +26,21 @@ class GameEngine:
     coordinating interactions between components.
     """
 
-    def __init__(self, config_path, base_output_dir="data/sessions", benchmark_config=None):
+    def __init__(self, config_path, base_output_dir="data/sessions", benchmark_config=None, config=None):
         """
         Initialize the game engine.
 
         Args:
             config_path (str): Path to the game configuration file
             base_dir (str, optional): Base directory for game session data
+            config (dict, optional): Already parsed game configuration, used instead of reading config_path
         """
-        logger.info(f"Initializing game from config: {config_path}")
-        self.config = ConfigLoader.load(config_path)
+        if config is not None:
+            logger.info("Initializing game from in-memory config derived from: %s", config_path)
+            self.config = ConfigLoader.from_dict(config)
+        else:
+            logger.info("Initializing game from config: %s", config_path)
+            self.config = ConfigLoader.load(config_path)
         self.benchmark_config = benchmark_config
 
         # Create a game session with the specified base directory and benchmark config
@@ -56,7 +61,7 @@ class GameEngine:
         self.game_name = self.config['game']['name']
         self.player_count = len(self.state.players)
 
-        logger.info(f"Initialized {self.game_name} with {self.player_count} players")
+        logger.info("Initialized %s with %s players", self.game_name, self.player_count)
 
     def run_game(self):
         """
@@ -64,13 +69,19 @@ class GameEngine:
 
         Executes the main game loop, processing phases until
         the game is complete. Saves state snapshots after each
-        phase for analysis.
+        phase for analysis. The session's log files are closed
+        when the game ends, including when it fails.
         """
-        logger.info(f"Starting game: {self.game_name}")
+        with self.game_session:
+            self._run_game()
+
+    def _run_game(self):
+        """Run the main game loop and save the final results."""
+        logger.info("Starting game: %s", self.game_name)
 
         # Log the start of the game
-        logger.info(f"Chat history will be logged to: {self.chat_logger.get_consolidated_log_path()}")
-        logger.info(f"Snapshots will be logged to: {self.game_session.snapshots_path}")
+        logger.info("Chat history will be logged to: %s", self.chat_logger.get_consolidated_log_path())
+        logger.info("Snapshots will be logged to: %s", self.game_session.snapshots_path)
 
         # Save initial state snapshot
         self.state.save_snapshot(is_initial=True)
@@ -88,87 +99,96 @@ class GameEngine:
             }
         )
 
+        # Bind frequently used attributes locally for the main loop
+        state = self.state
+        game_session = self.game_session
+
+        # Phase processors keyed by phase type
+        phase_processors = {
+            'automatic': self._process_automatic_phase,
+            'simultaneous_action': self._process_simultaneous_phase,
+            'sequential_action': self._process_sequential_phase,
+            'single_player_action': self._process_single_player_action,
+        }
+
         # Main game loop
-        while not self.state.is_game_over():
-            current_phase = self.state.current_phase
+        while not state.is_game_over():
+            current_phase = state.current_phase
             phase_config = self._get_phase_config(current_phase)
             phase_type = phase_config['type']
 
-            logger.info(f"Processing phase: {current_phase} (type: {phase_type})")
+            logger.info("Processing phase: %s (type: %s)", current_phase, phase_type)
 
             # Log phase start event
-            self.game_session.save_event(
+            current_round = state.shared_state.get('current_round', 0)
+            game_session.save_event(
                 "phase_start",
                 {
                     "phase_id": current_phase,
                     "phase_type": phase_type,
-                    "round": self.state.shared_state.get('current_round', 0)
+                    "round": current_round
                 },
                 phase_id=current_phase,
-                round_num=self.state.shared_state.get('current_round', 0)
+                round_num=current_round
             )
 
             # Process the phase based on its type
-            phase_result = False
-            if phase_type == 'automatic':
-                phase_result = self._process_automatic_phase(phase_config)
-            elif phase_type == 'simultaneous_action':
-                phase_result = self._process_simultaneous_phase(phase_config)
-            elif phase_type == 'sequential_action':
-                phase_result = self._process_sequential_phase(phase_config)
-            elif phase_type == 'single_player_action':
-                phase_result = self._process_single_player_action(phase_config)
-            elif phase_type == 'sequential_communication':
-                logger.error("sequential_communication phase type not yet implemented")
-                raise NotImplementedError(f"Phase type '{phase_type}' is not implemented")
-            else:
-                logger.error(f"Unknown phase type: {phase_type}")
+            process_phase = phase_processors.get(phase_type)
+            if process_phase is None:
+                if phase_type == 'sequential_communication':
+                    logger.error("sequential_communication phase type not yet implemented")
+                    raise NotImplementedError(f"Phase type '{phase_type}' is not implemented")
+                logger.error("Unknown phase type: %s", phase_type)
                 raise ValueError(f"Unknown phase type: {phase_type}")
+            phase_result = process_phase(phase_config)
 
-            # Log phase end event
-            self.game_session.save_event(
+            # Log phase end event (the phase may have advanced the round)
+            current_round = state.shared_state.get('current_round', 0)
+            game_session.save_event(
                 "phase_end",
                 {
                     "phase_id": current_phase,
                     "phase_type": phase_type,
                     "result": phase_result,
-                    "round": self.state.shared_state.get('current_round', 0)
+                    "round": current_round
                 },
                 phase_id=current_phase,
-                round_num=self.state.shared_state.get('current_round', 0)
+                round_num=current_round
             )
 
             # Determine next phase
             next_phase = self.phase_controller.get_next_phase(
-                self.state, current_phase, phase_result
+                state, current_phase, phase_result
             )
 
             # Save state snapshot after each phase
-            logger.info(f"Saving snapshot after phase: {current_phase}")
-            self.state.save_snapshot()
+            logger.info("Saving snapshot after phase: %s", current_phase)
+            state.save_snapshot()
+            game_session.end_phase()
 
-            logger.info(f"Transitioning from {current_phase} to {next_phase}")
+            logger.info("Transitioning from %s to %s", current_phase, next_phase)
 
             if next_phase == "game_end":
                 logger.info("Game end condition met")
-                self.state.game_over = True
+                state.game_over = True
 
                 # Log game end event
-                self.game_session.save_event(
+                winner = state.get_winner()
+                game_session.save_event(
                     "game_end",
                     {
-                        "winner": self.state.get_winner()['id'] if self.state.get_winner() else None,
-                        "rounds_played": self.state.shared_state.get('current_round', 0)
+                        "winner": winner['id'] if winner else None,
+                        "rounds_played": state.shared_state.get('current_round', 0)
                     }
                 )
             else:
-                self.state.current_phase = next_phase
+                state.current_phase = next_phase
 
-        logger.info(f"Game completed: {self.game_name}")
+        logger.info("Game completed: %s", self.game_name)
 
         # Save final results
         results_file = self.state.save_results()
-        logger.info(f"Game results saved to: {results_file}")
+        logger.info("Game results saved to: %s", results_file)
 
     def _process_automatic_phase(self, phase_config):
         """
@@ -210,10 +230,10 @@ class GameEngine:
                 elif player.get('role') == eligible_role:
                     active_players.append(player)
 
-            logger.info(f"Processing simultaneous actions for {len(active_players)} players with role '{eligible_role}'")
+            logger.info("Processing simultaneous actions for %s players with role '%s'", len(active_players), eligible_role)
         else:
             active_players = all_active_players
-            logger.info(f"Processing simultaneous actions for {len(active_players)} players")
+            logger.info("Processing simultaneous actions for %s players", len(active_players))
         return active_players
 
 
@@ -245,7 +265,7 @@ class GameEngine:
         responses = {}
         for player in eligible_players:
             player_id = player['id']
-            logger.info(f"Getting action for player: {player_id}")
+            logger.info("Getting action for player: %s", player_id)
 
             # Log player action start
             action_id = self.game_session.save_event(
@@ -319,7 +339,7 @@ class GameEngine:
         # Process each player in sequence
         for i, player in enumerate(eligible_players):
             player_id = player['id']
-            logger.info(f"Processing action for player {i+1}/{len(eligible_players)}: {player_id}")
+            logger.info("Processing action for player %s/%s: %s", i+1, len(eligible_players), player_id)
 
             # Log player action start
             action_id = self.game_session.save_event(
@@ -385,30 +405,30 @@ class GameEngine:
         eligible_player = None
 
         if not eligible_role:
-            logger.error(f"No eligible_role specified for single_player_action phase: {phase_config['id']}")
+            logger.error("No eligible_role specified for single_player_action phase: %s", phase_config['id'])
             raise ValueError(f"No eligible_role specified for single_player_action phase: {phase_config['id']}")
 
-        logger.info(f"Looking for a player with role '{eligible_role}'")
+        logger.info("Looking for a player with role '%s'", eligible_role)
 
-        # Debug all player roles
-        for player in self.state.players:
-            logger.info(f"Player {player['id']} has roles: {player.get('roles', [])}")
+        # Debug all player roles in a single log record
+        logger.info("\n".join(f"Player {player['id']} has roles: {player.get('roles', [])}"
+                               for player in self.state.players))
 
         for player in self.state.get_active_players():
             # Check the roles list first
             if 'roles' in player and eligible_role in player['roles']:
                 eligible_player = player
-                logger.info(f"Found eligible player {player['id']} with role {eligible_role} in roles list")
+                logger.info("Found eligible player %s with role %s in roles list", player['id'], eligible_role)
                 break
 
             # Backward compatibility check for single role
             if player.get('role') == eligible_role:
                 eligible_player = player
-                logger.info(f"Found eligible player {player['id']} with primary role {eligible_role}")
+                logger.info("Found eligible player %s with primary role %s", player['id'], eligible_role)
                 break
 
         if not eligible_player:
-            logger.error(f"No active player with role '{eligible_role}' found")
+            logger.error("No active player with role '%s' found", eligible_role)
             raise ValueError(f"No active player with role '{eligible_role}' found")
 
         player_id = eligible_player['id']
@@ -466,7 +486,7 @@ class GameEngine:
         Raises:
             ValueError: If the phase configuration is not found
         """
-        for phase in self.config['phases']:
-            if phase['id'] == phase_id:
-                return phase
-        raise ValueError(f"Phase configuration not found: {phase_id}")
+        phase = self.state.phases_by_id.get(phase_id)
+        if phase is None:
+            raise ValueError(f"Phase configuration not found: {phase_id}")
+        return phase
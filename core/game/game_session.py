@@ -7,6 +7,21 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+def _dumps_record(obj):
+    """
+    Serialize a session log record as one UTF-8 JSON line.
+
+    Uses json.dumps' default formatting for both snapshots.jsonl and
+    chat_logs.jsonl, so the files' bytes don't depend on optional packages.
+    """
+    return (json.dumps(obj) + "\n").encode('utf-8')
+
+# Use libyaml's emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 logger = logging.getLogger("GameSession")
 
 class GameSession:
@@ -15,9 +30,17 @@ class GameSession:
 
     Creates a unique session directory and provides methods
     for saving different types of game data.
+
+    Log records are buffered and never fsynced. With the default flush
+    level, "phase", they reach the files at phase boundaries and on
+    close(); records written since the last phase may be lost on a crash.
     """
 
-    def __init__(self, config, base_dir="data/sessions", benchmark_config=None):
+    # When buffered log records are written out: only on close(), at the
+    # end of each phase, or after every record
+    FLUSH_LEVELS = ("never", "phase", "event")
+
+    def __init__(self, config, base_dir="data/sessions", benchmark_config=None, flush_level="phase"):
         """
         Initialize a new game session.
 
@@ -25,7 +48,16 @@ class GameSession:
             config (dict): The game configuration
             base_dir (str): The base directory for all session data
             benchmark_config (BenchmarkConfig, optional): Benchmark configuration object
+            flush_level (str): When to flush buffered log records, one of FLUSH_LEVELS
+
+        Raises:
+            ValueError: If flush_level is not one of FLUSH_LEVELS
         """
+        if flush_level not in self.FLUSH_LEVELS:
+            raise ValueError(f"Invalid flush_level '{flush_level}', expected one of {self.FLUSH_LEVELS}")
+        self.flush_level = flush_level
+        self._flush_each_record = flush_level == "event"
+
         # Generate unique session ID
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.session_id = f"{config['game']['name'].lower().replace(' ', '_')}_{self.timestamp}"
@@ -41,7 +73,7 @@ class GameSession:
         self.config = config
         config_path = os.path.join(self.session_dir, "game_config.yaml")
         with open(config_path, 'w') as f:
-            yaml.dump(config, f)
+            yaml.dump(config, f, Dumper=_YamlDumper)
 
         # Save benchmark configuration if provided
         if benchmark_config:
@@ -54,7 +86,7 @@ class GameSession:
             # Save to file
             benchmark_path = os.path.join(self.session_dir, "benchmark_config.yaml")
             with open(benchmark_path, 'w') as f:
-                yaml.dump(benchmark_dict, f)
+                yaml.dump(benchmark_dict, f, Dumper=_YamlDumper)
 
             # Also save benchmark ID to a metadata file for easier reference
             benchmark_id = benchmark_dict.get('benchmark', {}).get('id', 'unknown')
@@ -67,7 +99,7 @@ class GameSession:
             with open(metadata_path, 'w') as f:
                 json.dump(metadata, f, indent=2)
 
-        logger.info(f"Created game session: {self.session_id} in {self.session_dir}")
+        logger.info("Created game session: %s in %s", self.session_id, self.session_dir)
 
 
         # Initialize paths for different log types
@@ -80,6 +112,47 @@ class GameSession:
         self.event_count = 0
         self.chat_message_count = 0
 
+        # Final results, kept in memory once written so callers needn't re-read the file
+        self.results = None
+
+        # Log files, opened on first write and kept open until close()
+        self._snapshots_file = None
+        self._chat_log_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _write_snapshot_record(self, record):
+        """Append a record to the snapshots file through the session's open handle."""
+        snapshots_file = self._snapshots_file
+        if snapshots_file is None:
+            snapshots_file = self._snapshots_file = open(self.snapshots_path, 'ab', buffering=1 << 16)
+        snapshots_file.write(_dumps_record(record))
+        if self._flush_each_record:
+            snapshots_file.flush()
+
+    def end_phase(self):
+        """Mark the end of a game phase, flushing buffered records unless flush_level is "never"."""
+        if self.flush_level != "never":
+            self.flush()
+
+    def flush(self):
+        """
+        Write buffered log records to disk.
+
+        Records are coalesced in the open file handles' buffers; flushing at
+        phase boundaries keeps the files current without a write per record.
+        This only hands the data to the OS; it does not fsync.
+        """
+        if self._snapshots_file is not None:
+            self._snapshots_file.flush()
+        if self._chat_log_file is not None:
+            self._chat_log_file.flush()
+
     def save_snapshot(self, snapshot_data):
         """
         Save a game state snapshot.
@@ -93,8 +166,7 @@ class GameSession:
         snapshot_data["record_type"] = "snapshot"
 
         # Append to snapshots file
-        with open(self.snapshots_path, 'a') as f:
-            f.write(json.dumps(snapshot_data) + "\n")
+        self._write_snapshot_record(snapshot_data)
 
         self.snapshot_count += 1
         return self.snapshot_count - 1  # Return the snapshot ID
@@ -109,9 +181,13 @@ class GameSession:
         # Add session metadata
         chat_data["session_id"] = self.session_id
 
-        # Append to chat logs file
-        with open(self.chat_logs_path, 'a') as f:
-            f.write(json.dumps(chat_data) + "\n")
+        # Append to chat logs file through the session's open handle
+        chat_log_file = self._chat_log_file
+        if chat_log_file is None:
+            chat_log_file = self._chat_log_file = open(self.chat_logs_path, 'ab', buffering=1 << 16)
+        chat_log_file.write(_dumps_record(chat_data))
+        if self._flush_each_record:
+            chat_log_file.flush()
 
         self.chat_message_count += 1
 
@@ -137,8 +213,7 @@ class GameSession:
         }
 
         # Append to snapshots file since it's the consolidated record
-        with open(self.snapshots_path, 'a') as f:
-            f.write(json.dumps(event) + "\n")
+        self._write_snapshot_record(event)
 
         self.event_count += 1
         return self.event_count - 1  # Return the event ID
@@ -159,8 +234,25 @@ class GameSession:
             "chat_message_count": self.chat_message_count
         }
 
-        # Write to results file
-        with open(self.results_path, 'w') as f:
-            json.dump(results_data, f, indent=2)
+        # Write to results file in one call, replacing it atomically so
+        # readers never see a partially written file
+        tmp_path = f"{self.results_path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(json.dumps(results_data, indent=2).encode('utf-8'))
+        os.replace(tmp_path, self.results_path)
+
+        self.results = results_data
+        return self.results_path
 
-        return self.results_path
\ No newline at end of file
+    def close(self):
+        """
+        Flush and close any log files held open by the session.
+
+        Safe to call more than once; a later write reopens the file in append mode.
+        """
+        if self._snapshots_file is not None:
+            self._snapshots_file.close()
+            self._snapshots_file = None
+        if self._chat_log_file is not None:
+            self._chat_log_file.close()
+            self._chat_log_file = None
\ No newline at end of file
@@ -53,11 +53,11 @@ class PhaseHandler:
         """
         current_phase = game_state.current_phase
 
-        for phase in game_state.config['phases']:
-            if phase['id'] == current_phase:
-                return phase
+        phase = game_state.phases_by_id.get(current_phase)
+        if phase is None:
+            raise ValueError(f"Phase configuration not found: {current_phase}")
 
-        raise ValueError(f"Phase configuration not found: {current_phase}")
+        return phase
 
 
 class PhaseController:
@@ -80,7 +80,7 @@ class PhaseController:
         Returns:
             str: The next phase ID, or 'game_end' if game should end
         """
-        phase_config = self._get_phase_config(game_state.config, current_phase)
+        phase_config = self._get_phase_config(game_state, current_phase)
 
         # Handle conditional transitions
         if 'next_phase_condition' in phase_config:
@@ -92,12 +92,12 @@ class PhaseController:
         # Handle simple transitions
         return phase_config.get('next_phase', 'game_end')
 
-    def _get_phase_config(self, config, phase_id):
+    def _get_phase_config(self, game_state, phase_id):
         """
         Get the configuration for a specific phase.
 
         Args:
-            config (dict): The game configuration
+            game_state (GameState): The current game state
             phase_id (str): The phase ID to find
 
         Returns:
@@ -106,8 +106,8 @@ class PhaseController:
         Raises:
             ValueError: If the phase configuration is not found
         """
-        for phase in config['phases']:
-            if phase['id'] == phase_id:
-                return phase
+        phase = game_state.phases_by_id.get(phase_id)
+        if phase is None:
+            raise ValueError(f"Phase configuration not found: {phase_id}")
 
-        raise ValueError(f"Phase configuration not found: {phase_id}")
+        return phase
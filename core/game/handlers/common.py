@@ -1,11 +1,22 @@
 # handlers/common.py
 import logging
+import random
+from collections import Counter
 from core.game.handlers.base import PhaseHandler
 from core.game.handlers.registry import HandlerRegistry
 from core.llm.production_llm_client import ProductionLLMClient
 
 logger = logging.getLogger("ProductionHandlers")
 
+# Prisoner's Dilemma payoffs keyed by (player decision, opponent decision).
+# Any pair not listed here scores as mutual defection.
+_PD_POINTS = {
+    ("cooperate", "cooperate"): 3,
+    ("defect", "cooperate"): 5,
+    ("cooperate", "defect"): 0,
+    ("defect", "defect"): 1,
+}
+
 @HandlerRegistry.register("player_action_handler")
 class PlayerActionHandler(PhaseHandler):
     """
@@ -41,20 +52,20 @@ class PlayerActionHandler(PhaseHandler):
         phase_config = self._get_phase_config(game_state)
         player_id = player['id']
 
-        logger.info(f"Getting action for player {player_id} in phase {phase_id}")
+        logger.info("Getting action for player %s in phase %s", player_id, phase_id)
 
         try:
             action = self.llm_client.get_action(game_state, player, phase_id)
 
             if action is None:
-                logger.error(f"Received None action for player {player_id}")
+                logger.error("Received None action for player %s", player_id)
                 raise ValueError("Received None action from LLM client")
 
-            logger.info(f"Player {player_id} chose: {action}")
+            logger.info("Player %s chose: %s", player_id, action)
             return action
 
         except Exception as e:
-            logger.error(f"Error getting action for player {player_id}: {str(e)}")
+            logger.error("Error getting action for player %s: %s", player_id, e)
             raise ValueError(f"Error getting action from LLM client: {str(e)}")
 
     def process(self, game_state):
@@ -97,26 +108,32 @@ class PDOutcomeHandler(PhaseHandler):
         """
         # Get decisions from state
         decisions = game_state.shared_state.get("decision_responses", {})
-        logger.info(f"Processing PD outcomes with decisions: {decisions}")
+        logger.info("Processing PD outcomes with decisions: %s", decisions)
+
+        # Normalize each decision once rather than on every scoring call;
+        # missing or empty decisions are left out so scoring rejects them
+        normalized = {
+            player_id: decision.lower().strip()
+            for player_id, decision in decisions.items()
+            if decision
+        }
 
         # Apply scoring rules
-        for player in game_state.get_active_players():
+        active_players = game_state.get_active_players()
+        for player in active_players:
             player_id = player['id']
             player_decision = decisions.get(player_id)
 
-            # Get opponent's decision
-            opponent = None
-            for p in game_state.get_active_players():
-                if p['id'] != player_id:
-                    opponent = p
-                    break
+            # Get opponent's decision; the first other active player is
+            # always at the front of the list, so this stops almost at once
+            opponent = next((p for p in active_players if p['id'] != player_id), None)
 
             if opponent:
                 opponent_id = opponent['id']
                 opponent_decision = decisions.get(opponent_id)
 
                 # Calculate points
-                points = self._calculate_points(player_decision, opponent_decision)
+                points = self._calculate_points(normalized.get(player_id), normalized.get(opponent_id))
 
                 # Initialize score if not present
                 if 'score' not in player['state']:
@@ -124,7 +141,7 @@ class PDOutcomeHandler(PhaseHandler):
 
                 # Update score
                 player['state']['score'] += points
-                logger.info(f"Player {player_id} ({player_decision}) vs {opponent_id} ({opponent_decision}): +{points} points")
+                logger.info("Player %s (%s) vs %s (%s): +%s points", player_id, player_decision, opponent_id, opponent_decision, points)
 
         # Record in history
         if 'decision_history' in game_state.history_state:
@@ -132,7 +149,7 @@ class PDOutcomeHandler(PhaseHandler):
                 'round': game_state.shared_state['current_round'],
                 'decisions': decisions,
             })
-            logger.info(f"Added to decision history: round {game_state.shared_state['current_round']}, decisions: {decisions}")
+            logger.info("Added to decision history: round %s, decisions: %s", game_state.shared_state['current_round'], decisions)
 
         # Check if this is the final round
         is_final_round = game_state.shared_state['current_round'] >= game_state.config['rounds']['count']
@@ -150,29 +167,18 @@ class PDOutcomeHandler(PhaseHandler):
         Calculate points based on decisions.
 
         Args:
-            player_decision (str): The player's decision
-            opponent_decision (str): The opponent's decision
+            player_decision (str): The player's lowercased, stripped decision, None if missing
+            opponent_decision (str): The opponent's lowercased, stripped decision, None if missing
 
         Returns:
             int: Points earned
         """
         # Fail if decisions are not valid
-        if not player_decision or not opponent_decision:
-            logger.error(f"Invalid decisions: player_decision={player_decision}, opponent_decision={opponent_decision}")
+        if player_decision is None or opponent_decision is None:
+            logger.error("Invalid decisions: player_decision=%s, opponent_decision=%s", player_decision, opponent_decision)
             raise ValueError(f"Invalid decisions in PD outcome calculation: player={player_decision}, opponent={opponent_decision}")
 
-        # Normalize decisions
-        player_decision = player_decision.lower().strip()
-        opponent_decision = opponent_decision.lower().strip()
-
-        if player_decision == "cooperate" and opponent_decision == "cooperate":
-            return 3
-        elif player_decision == "defect" and opponent_decision == "cooperate":
-            return 5
-        elif player_decision == "cooperate" and opponent_decision == "defect":
-            return 0
-        else:  # Both defect
-            return 1
+        return _PD_POINTS.get((player_decision, opponent_decision), 1)
 
 
 @HandlerRegistry.register("eliminate_most_voted")
@@ -193,18 +199,16 @@ class EliminateMostVotedHandler(PhaseHandler):
         """
         # Get votes from shared state
         votes = game_state.get_votes()
-        logger.info(f"Processing elimination with votes: {votes}")
+        logger.info("Processing elimination with votes: %s", votes)
 
         if not votes:
             logger.warning("No votes found, cannot eliminate any player")
             return False
 
         # Count votes for each player
-        vote_counts = {}
-        for player_id, voted_for in votes.items():
-            vote_counts[voted_for] = vote_counts.get(voted_for, 0) + 1
+        vote_counts = dict(Counter(votes.values()))
 
-        logger.info(f"Vote counts: {vote_counts}")
+        logger.info("Vote counts: %s", vote_counts)
 
         # Find the player with the most votes
         most_votes = 0
@@ -224,23 +228,22 @@ class EliminateMostVotedHandler(PhaseHandler):
         tied_players = [p for p, c in vote_counts.items() if c == most_votes]
 
         if len(tied_players) > 1:
-            logger.info(f"Tie detected between players: {tied_players}")
+            logger.info("Tie detected between players: %s", tied_players)
 
             # Get tiebreaker rule
             tiebreakers = game_state.config.get('tiebreakers', ['random_selection'])
             tiebreaker = tiebreakers[0] if tiebreakers else 'random_selection'
 
-            logger.info(f"Using tiebreaker: {tiebreaker}")
+            logger.info("Using tiebreaker: %s", tiebreaker)
 
             if tiebreaker == 'random_selection':
                 # Randomly select one of the tied players
-                import random
                 most_voted = random.choice(tied_players)
-                logger.info(f"Randomly selected {most_voted} from tied players")
+                logger.info("Randomly selected %s from tied players", most_voted)
 
         # Eliminate the player with the most votes
         if most_voted:
-            logger.info(f"Eliminating player {most_voted} with {most_votes} votes")
+            logger.info("Eliminating player %s with %s votes", most_voted, most_votes)
             game_state.eliminate_player(most_voted)
 
             # Record elimination in shared state if tracking exists
@@ -259,7 +262,7 @@ class EliminateMostVotedHandler(PhaseHandler):
 
         # Check if only one player remains
         active_players = game_state.get_active_players()
-        logger.info(f"Active players remaining: {len(active_players)}")
+        logger.info("Active players remaining: %s", len(active_players))
 
         return len(active_players) <= 1
 
@@ -281,7 +284,7 @@ class CheckLastPlayerStandingHandler(PhaseHandler):
             bool: True if only one player remains, False otherwise
         """
         active_players = game_state.get_active_players()
-        logger.info(f"Checking win condition: {len(active_players)} active players")
+        logger.info("Checking win condition: %s active players", len(active_players))
 
         # Return True if only one player remains
         return len(active_players) <= 1
@@ -306,7 +309,7 @@ class ValidateLetterAdditionHandler(PhaseHandler):
         letter = responses.get(player_id, '')
 
         if not letter:
-            logger.warning(f"No letter provided by player {player_id}")
+            logger.warning("No letter provided by player %s", player_id)
             return False
 
         # Take just the first character if multiple were provided
@@ -316,7 +319,7 @@ class ValidateLetterAdditionHandler(PhaseHandler):
         new_fragment = word_fragment + letter
         game_state.shared_state['word_fragment'] = new_fragment
 
-        logger.info(f"Player {player_id} added letter '{letter}', new fragment: '{new_fragment}'")
+        logger.info("Player %s added letter '%s', new fragment: '%s'", player_id, letter, new_fragment)
 
         # In a real implementation, we would check against a dictionary here
         # For simplicity, we'll just return True for testing
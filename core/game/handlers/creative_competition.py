@@ -1,24 +1,35 @@
 # core/game/handlers/creative_competition.py
 import logging
 import random
+from collections import Counter
+from functools import lru_cache
 from core.game.handlers.base import PhaseHandler
 from core.game.handlers.registry import HandlerRegistry
 from core.llm.production_llm_client import ProductionLLMClient
 
 logger = logging.getLogger("CreativeCompetition")
 
+# Lowercase game-name keywords mapped to the content type they produce, in match order
+_CONTENT_TYPES = (
+    ('poetry', 'poem'),
+    ('story', 'story'),
+)
+
+
+@lru_cache(maxsize=None)
+def _content_type_for(game_name):
+    """Resolve the content type for a game name, memoized per name."""
+    game_name = game_name.lower()
+    return next((content_type for keyword, content_type in _CONTENT_TYPES if keyword in game_name),
+                'creative content')
+
+
 class CreativeCompetitionBase:
     """Base class with shared methods for creative competition handlers."""
 
     def get_content_type(self, game_state):
         """Get the content type from the game configuration."""
-        game_name = game_state.config['game']['name'].lower()
-        if 'poetry' in game_name:
-            return 'poem'
-        elif 'story' in game_name:
-            return 'story'
-        else:
-            return 'creative content'
+        return _content_type_for(game_state.config['game']['name'])
 
 
 @HandlerRegistry.register("creative_prompt_handler")
@@ -42,7 +53,7 @@ class CreativePromptHandler(PhaseHandler, CreativeCompetitionBase):
         has_prompter_role = ('roles' in player and 'prompter' in player['roles']) or player.get('role') == 'prompter'
 
         if not has_prompter_role:
-            logger.warning(f"Player {player['id']} is not the prompter but was asked to create a prompt")
+            logger.warning("Player %s is not the prompter but was asked to create a prompt", player['id'])
             return None
 
         # Add content type to context
@@ -58,7 +69,7 @@ class CreativePromptHandler(PhaseHandler, CreativeCompetitionBase):
             extra_context=extra_context
         )
 
-        logger.info(f"Received prompt from player {player['id']}: {prompt[:50]}...")
+        logger.info("Received prompt from player %s: %s...", player['id'], prompt[:50])
 
         # Store the prompt in shared state immediately
         game_state.shared_state['content_prompt'] = prompt
@@ -106,7 +117,7 @@ class CreativeContentHandler(PhaseHandler, CreativeCompetitionBase):
         # Store in player state for easy access
         player['state']['submission'] = content
 
-        logger.info(f"Received content from player {player['id']}: {content[:50]}...")
+        logger.info("Received content from player %s: %s...", player['id'], content[:50])
 
         return content
 
@@ -138,7 +149,7 @@ class ContentVotingHandler(PhaseHandler, CreativeCompetitionBase):
                     submissions[p['id']] = p['state']['submission']
 
         if not submissions:
-            logger.error(f"No submissions available for player {player_id} to vote on")
+            logger.error("No submissions available for player %s to vote on", player_id)
             raise ValueError("No valid submissions to vote on")
 
         # Format submissions for the prompt
@@ -167,10 +178,10 @@ class ContentVotingHandler(PhaseHandler, CreativeCompetitionBase):
 
         # Validate vote - must be a player ID and not self
         if vote not in submissions:
-            logger.warning(f"Invalid vote from player {player_id}: {vote}. Defaulting to None.")
+            logger.warning("Invalid vote from player %s: %s. Defaulting to None.", player_id, vote)
             return None
 
-        logger.info(f"Player {player_id} voted for: {vote}")
+        logger.info("Player %s voted for: %s", player_id, vote)
 
         return vote
 
@@ -191,14 +202,12 @@ class TallyVotesHandler(PhaseHandler, CreativeCompetitionBase):
             logger.warning("No votes found, cannot determine winner")
             return True
 
-        logger.info(f"Processing resolution with votes: {votes}")
+        logger.info("Processing resolution with votes: %s", votes)
 
         # Count votes for each player
-        vote_counts = {}
-        for player_id, voted_for in votes.items():
-            vote_counts[voted_for] = vote_counts.get(voted_for, 0) + 1
+        vote_counts = dict(Counter(votes.values()))
 
-        logger.info(f"Vote counts: {vote_counts}")
+        logger.info("Vote counts: %s", vote_counts)
 
         # Find player(s) with the most votes
         max_votes = 0
@@ -223,7 +232,7 @@ class TallyVotesHandler(PhaseHandler, CreativeCompetitionBase):
 
         # Log the winner(s)
         if len(winners) == 1:
-            logger.info(f"Winner: {winners[0]} with {max_votes} votes")
+            logger.info("Winner: %s with %s votes", winners[0], max_votes)
             game_state.game_session.save_event(
                 "game_results",
                 {
@@ -232,7 +241,7 @@ class TallyVotesHandler(PhaseHandler, CreativeCompetitionBase):
                 }
             )
         else:
-            logger.info(f"Tie between players: {winners} with {max_votes} votes each")
+            logger.info("Tie between players: %s with %s votes each", winners, max_votes)
             game_state.game_session.save_event(
                 "game_results",
                 {
@@ -4,6 +4,7 @@ import random
 import copy
 from core.game.handlers.base import PhaseHandler
 from core.game.handlers.registry import HandlerRegistry
+from core.llm.production_llm_client import ProductionLLMClient
 
 logger = logging.getLogger("DebateCompetition")
 
@@ -52,7 +53,7 @@ class DebateTopicSelectionHandler(PhaseHandler):
         game_state.shared_state['debate_topic'] = selected_topic['topic']
         game_state.shared_state['sides'] = selected_topic['sides']
 
-        logger.info(f"Selected debate topic: {selected_topic['topic']}")
+        logger.info("Selected debate topic: %s", selected_topic['topic'])
 
         # Log the event
         game_state.game_session.save_event(
@@ -76,17 +77,17 @@ class DebateSideAssignmentHandler(PhaseHandler):
         debaters = [p for p in game_state.get_active_players()
                     if ('roles' in p and 'debater' in p['roles']) or p.get('role') == 'debater']
 
-        logger.info(f"Found {len(debaters)} active debaters")
+        logger.info("Found %s active debaters", len(debaters))
 
         # For standard debate, we need exactly 2 debaters
         if len(debaters) != 2:
-            logger.error(f"Expected 2 debaters, found {len(debaters)}")
+            logger.error("Expected 2 debaters, found %s", len(debaters))
             raise ValueError(f"Expected 2 debaters, found {len(debaters)}")
 
         # Get sides from shared state
         sides = game_state.shared_state.get('sides', [])
         if len(sides) != 2:
-            logger.error(f"Expected 2 sides, found {len(sides)}")
+            logger.error("Expected 2 sides, found %s", len(sides))
             raise ValueError(f"Expected 2 sides, found {len(sides)}")
 
         # Assign sides to debaters (randomly for the first debate)
@@ -104,8 +105,8 @@ class DebateSideAssignmentHandler(PhaseHandler):
         first_rebutter_side_id = random.choice([sides[0]['side_id'], sides[1]['side_id']])
         game_state.shared_state['first_rebutter_side_id'] = first_rebutter_side_id
 
-        logger.info(f"Assigned sides: {debater1['id']} -> {sides[0]['side_id']}, {debater2['id']} -> {sides[1]['side_id']}")
-        logger.info(f"First rebutter side: {first_rebutter_side_id}")
+        logger.info("Assigned sides: %s -> %s, %s -> %s", debater1['id'], sides[0]['side_id'], debater2['id'], sides[1]['side_id'])
+        logger.info("First rebutter side: %s", first_rebutter_side_id)
 
         # Log the event
         game_state.game_session.save_event(
@@ -135,7 +136,7 @@ class DebateSideAssignmentHandler(PhaseHandler):
 
         game_state.players = new_players
 
-        logger.info(f"Reordered players array with first rebutter {first_rebutter_side_id} first among debaters")
+        logger.info("Reordered players array with first rebutter %s first among debaters", first_rebutter_side_id)
 
         return True
 
@@ -150,8 +151,6 @@ class DebateArgumentHandler(PhaseHandler):
 
     def process_player(self, game_state, player):
         """Process a player's opening argument."""
-        from core.llm.production_llm_client import ProductionLLMClient
-
         if self.llm_client is None:
             self.llm_client = ProductionLLMClient(chat_logger=game_state.chat_logger)
 
@@ -160,7 +159,7 @@ class DebateArgumentHandler(PhaseHandler):
         position = player['state'].get('position')
 
         if not side_id or not position:
-            logger.error(f"Player {player['id']} does not have an assigned debate side")
+            logger.error("Player %s does not have an assigned debate side", player['id'])
             raise ValueError(f"Player {player['id']} does not have an assigned debate side")
 
         # Add context for the opening argument
@@ -180,7 +179,7 @@ class DebateArgumentHandler(PhaseHandler):
             extra_context=extra_context
         )
 
-        logger.info(f"Received opening argument from {player['id']} for side {side_id}")
+        logger.info("Received opening argument from %s for side %s", player['id'], side_id)
 
         # Store in shared state for access by other players
         current_arguments = game_state.shared_state.get('current_arguments', {})
@@ -206,19 +205,17 @@ class DebateRebuttalHandler(PhaseHandler):
         current_round = game_state.shared_state.get('current_round', 1)
         max_rounds = game_state.shared_state.get('max_rounds', 3)
 
-        logger.info(f"DebateRebuttalHandler - Round {current_round}/{max_rounds}")
+        logger.info("DebateRebuttalHandler - Round %s/%s", current_round, max_rounds)
 
         # Return True ONLY if we're in the final round
         is_final_round = (current_round >= max_rounds)
 
-        logger.info(f"DebateRebuttalHandler - Is final round? {is_final_round}")
+        logger.info("DebateRebuttalHandler - Is final round? %s", is_final_round)
         return is_final_round
 
 
     def process_player(self, game_state, player):
         """Process a player's rebuttal."""
-        from core.llm.production_llm_client import ProductionLLMClient
-
         if self.llm_client is None:
             self.llm_client = ProductionLLMClient(chat_logger=game_state.chat_logger)
 
@@ -227,7 +224,7 @@ class DebateRebuttalHandler(PhaseHandler):
         position = player['state'].get('position')
 
         if not side_id or not position:
-            logger.error(f"Player {player['id']} does not have an assigned debate side")
+            logger.error("Player %s does not have an assigned debate side", player['id'])
             raise ValueError(f"Player {player['id']} does not have an assigned debate side")
 
         # Get all current arguments
@@ -302,7 +299,7 @@ class DebateRebuttalHandler(PhaseHandler):
             extra_context=extra_context
         )
 
-        logger.info(f"Received rebuttal from {player['id']} for side {side_id} in round {game_state.shared_state.get('current_round', 1)}")
+        logger.info("Received rebuttal from %s for side %s in round %s", player['id'], side_id, game_state.shared_state.get('current_round', 1))
 
         # Update the player's current argument in player state and shared state
         player['state']['current_argument'] = rebuttal
@@ -376,14 +373,12 @@ class DebateJudgingHandler(PhaseHandler):
 
     def process_player(self, game_state, player):
         """Process a judge's opinion after a round."""
-        from core.llm.production_llm_client import ProductionLLMClient
-
         if self.llm_client is None:
             self.llm_client = ProductionLLMClient(chat_logger=game_state.chat_logger)
 
         # Ensure this is a judge
         if 'roles' not in player or 'judge' not in player['roles']:
-            logger.error(f"Player {player['id']} is not a judge")
+            logger.error("Player %s is not a judge", player['id'])
             raise ValueError(f"Player {player['id']} is not a judge")
 
         formatted_history = get_formatted_history(game_state)
@@ -413,7 +408,7 @@ class DebateJudgingHandler(PhaseHandler):
             extra_context=extra_context
         )
 
-        logger.info(f"Received opinion from judge {player['id']} in round {game_state.shared_state.get('current_round', 1)}: {opinion}")
+        logger.info("Received opinion from judge %s in round %s: %s", player['id'], game_state.shared_state.get('current_round', 1), opinion)
 
         # Store judge's opinion
         judge_opinions = game_state.shared_state.get('judge_opinions', {})
@@ -454,14 +449,12 @@ class DebateFinalJudgingHandler(PhaseHandler):
 
     def process_player(self, game_state, player):
         """Process a judge's final opinion."""
-        from core.llm.production_llm_client import ProductionLLMClient
-
         if self.llm_client is None:
             self.llm_client = ProductionLLMClient(chat_logger=game_state.chat_logger)
 
         # Ensure this is a judge
         if 'roles' not in player or 'judge' not in player['roles']:
-            logger.error(f"Player {player['id']} is not a judge")
+            logger.error("Player %s is not a judge", player['id'])
             raise ValueError(f"Player {player['id']} is not a judge")
 
         formatted_history = get_formatted_history(game_state)
@@ -491,7 +484,7 @@ class DebateFinalJudgingHandler(PhaseHandler):
             extra_context=extra_context
         )
 
-        logger.info(f"Received final opinion from judge {player['id']}: {final_opinion}")
+        logger.info("Received final opinion from judge %s: %s", player['id'], final_opinion)
 
         # Store judge's final opinion
         judge_opinions = game_state.shared_state.get('judge_opinions', {})
@@ -550,7 +543,7 @@ class DebateFinalJudgingHandler(PhaseHandler):
             complete_history['first_debate'] = first_debate_results
             game_state.hidden_state['complete_history'] = complete_history
 
-            logger.info(f"Stored first debate results in pre_swap: {side_votes}")
+            logger.info("Stored first debate results in pre_swap: %s", side_votes)
             return True
 
         else:
@@ -578,7 +571,7 @@ class DebateFinalJudgingHandler(PhaseHandler):
             complete_history['second_debate'] = second_debate_results
             game_state.hidden_state['complete_history'] = complete_history
 
-            logger.info(f"Stored second debate results in post_swap: {side_votes}")
+            logger.info("Stored second debate results in post_swap: %s", side_votes)
             return False
 
 
@@ -593,7 +586,7 @@ class DebateSideSwapHandler(PhaseHandler):
                    if 'roles' in p and 'debater' in p['roles']]
 
         if len(debaters) != 2:
-            logger.error(f"Expected 2 debaters, found {len(debaters)}")
+            logger.error("Expected 2 debaters, found %s", len(debaters))
             raise ValueError(f"Expected 2 debaters, found {len(debaters)}")
 
         # Swap sides between debaters
@@ -617,8 +610,8 @@ class DebateSideSwapHandler(PhaseHandler):
         # Keep the same first rebutter side_id (so the other debater goes first now)
         first_rebutter_side_id = game_state.shared_state.get('first_rebutter_side_id', '')
 
-        logger.info(f"Swapped sides: {debater1['id']} -> {debater1['state']['side_id']}, {debater2['id']} -> {debater2['state']['side_id']}")
-        logger.info(f"First rebutter side remains: {first_rebutter_side_id}")
+        logger.info("Swapped sides: %s -> %s, %s -> %s", debater1['id'], debater1['state']['side_id'], debater2['id'], debater2['state']['side_id'])
+        logger.info("First rebutter side remains: %s", first_rebutter_side_id)
 
         # Reset judge opinions for the new debate
         game_state.shared_state['judge_opinions'] = {}
@@ -665,7 +658,7 @@ class DebateSideSwapHandler(PhaseHandler):
 
         game_state.players = new_players
 
-        logger.info(f"Reordered players array with first rebutter {first_rebutter_side_id} first among debaters")
+        logger.info("Reordered players array with first rebutter %s first among debaters", first_rebutter_side_id)
 
 
         return True
@@ -682,7 +675,7 @@ class DebateResolutionHandler(PhaseHandler):
                    if 'roles' in p and 'debater' in p['roles']]
 
         if len(debaters) != 2:
-            logger.error(f"Expected 2 debaters, found {len(debaters)}")
+            logger.error("Expected 2 debaters, found %s", len(debaters))
             raise ValueError(f"Expected 2 debaters, found {len(debaters)}")
 
         # Calculate total votes across both debates
@@ -698,8 +691,8 @@ class DebateResolutionHandler(PhaseHandler):
             if 'current_argument' in debater['state']:
                 del debater['state']['current_argument']
 
-            logger.info(f"Debater {debater['id']} final score: {total_score} " +
-                       f"(pre-swap: {pre_swap_score}, post-swap: {post_swap_score})")
+            logger.info("Debater %s final score: %s (pre-swap: %s, post-swap: %s)",
+                        debater['id'], total_score, pre_swap_score, post_swap_score)
 
         # Determine winner
         debater1, debater2 = debaters
@@ -714,7 +707,7 @@ class DebateResolutionHandler(PhaseHandler):
 
         # Log the final result
         if winner:
-            logger.info(f"Winner: {winner['id']} with {winner['state']['score']} total votes")
+            logger.info("Winner: %s with %s total votes", winner['id'], winner['state']['score'])
             game_state.game_session.save_event(
                 "game_results",
                 {
@@ -726,7 +719,7 @@ class DebateResolutionHandler(PhaseHandler):
                 }
             )
         else:
-            logger.info(f"Tie between {debater1['id']} and {debater2['id']} with {debater1['state']['score']} votes each")
+            logger.info("Tie between %s and %s with %s votes each", debater1['id'], debater2['id'], debater1['state']['score'])
             game_state.game_session.save_event(
                 "game_results",
                 {
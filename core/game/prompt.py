@@ -22,7 +22,7 @@ class PromptManager:
         """
         self.templates_dir = templates_dir
         self.templates = {}
-        logger.info(f"Initialized PromptManager with templates directory: {templates_dir}")
+        logger.info("Initialized PromptManager with templates directory: %s", templates_dir)
 
     def load_template(self, template_name):
         """
@@ -46,7 +46,7 @@ class PromptManager:
         else:
             path = os.path.join(self.templates_dir, f"{template_name}.txt")
 
-        logger.debug(f"Loading template from: {path}")
+        logger.debug("Loading template from: %s", path)
 
         try:
             with open(path, 'r') as f:
@@ -122,7 +122,7 @@ class PromptManager:
         if 'decision_history' in game_state.history_state and player:
             decision_history = self._format_decision_history(game_state.history_state['decision_history'], player['id'])
             context["decision_history"] = decision_history
-            logger.info(f"Added decision history for {player['id']}: {decision_history}")
+            logger.info("Added decision history for %s: %s", player['id'], decision_history)
         else:
             context["decision_history"] = "No previous rounds"
             logger.info("No decision history available")
@@ -174,5 +174,5 @@ class PromptManager:
             return template.format(**safe_context)
         except KeyError as e:
             missing_key = str(e).strip("'")
-            logger.error(f"Missing key '{missing_key}' in template formatting")
+            logger.error("Missing key '%s' in template formatting", missing_key)
             raise ValueError(f"Template formatting failed: Missing key '{missing_key}' in context")
\ No newline at end of file
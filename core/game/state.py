@@ -3,6 +3,7 @@ import os
 import json
 import time
 import copy
+import random
 
 class GameState:
     """
@@ -23,6 +24,8 @@ class GameState:
         """
         self.config = config
         self.game_session = game_session
+        self.phases_by_id = self._index_phases()
+        self.player_models = config.get('llm_integration', {}).get('player_models', {})
         self.players = self._initialize_players()
         self.shared_state = self._initialize_shared_state()
         self.hidden_state = self._initialize_hidden_state()
@@ -40,6 +43,19 @@ class GameState:
         # Store phase result for conditional phase transitions
         self.phase_result = None
 
+    def _index_phases(self):
+        """
+        Index the configured phases by ID for constant-time lookup.
+
+        Returns:
+            dict: Mapping of phase ID to phase configuration, keeping the first
+                definition when an ID is repeated
+        """
+        phases_by_id = {}
+        for phase in self.config['phases']:
+            phases_by_id.setdefault(phase['id'], phase)
+        return phases_by_id
+
     def _initialize_players(self):
         """
         Initialize player state based on configuration.
@@ -74,12 +90,11 @@ class GameState:
                 target = assignment.get('assignment_to')
 
                 if target == 'random_player':
-                    import random
                     selected_player = random.choice(players)
                     if role not in selected_player['roles']:
                         selected_player['roles'].append(role)
                     selected_player['state']['role'] = role  # Legacy support
-                    # logger.info(f"Assigned role '{role}' to random player {selected_player['id']}")
+                    # logger.info("Assigned role '%s' to random player %s", role, selected_player['id'])
 
                 elif target == 'all_players':
                     for player in players:
@@ -88,7 +103,7 @@ class GameState:
                         # Only set state.role if not already set to preserve primary role
                         if not player['state'].get('role'):
                             player['state']['role'] = role
-                    # logger.info(f"Assigned role '{role}' to all players")
+                    # logger.info("Assigned role '%s' to all players", role)
 
                 else:
                     # Direct assignment to specific player
@@ -97,7 +112,7 @@ class GameState:
                             if role not in player['roles']:
                                 player['roles'].append(role)
                             player['state']['role'] = role  # Legacy support
-                            # logger.info(f"Assigned role '{role}' to player {player['id']}")
+                            # logger.info("Assigned role '%s' to player %s", role, player['id'])
                             break
 
             # For backward compatibility, set the 'role' field to the primary role
@@ -309,11 +324,16 @@ class GameState:
             if not active_players:
                 return None
 
-            # Find the maximum score
-            max_score = max((p['state'].get(score_field, 0) for p in active_players), default=0)
-
-            # Find all players with the maximum score
-            players_with_max_score = [p for p in active_players if p['state'].get(score_field, 0) == max_score]
+            # Find the maximum score and all players with it in a single pass
+            max_score = None
+            players_with_max_score = []
+            for p in active_players:
+                score = p['state'].get(score_field, 0)
+                if max_score is None or score > max_score:
+                    max_score = score
+                    players_with_max_score = [p]
+                elif score == max_score:
+                    players_with_max_score.append(p)
 
             # If only one player has the max score, they win
             if len(players_with_max_score) == 1:
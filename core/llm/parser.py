@@ -4,6 +4,49 @@ import re
 
 logger = logging.getLogger("ResponseParser")
 
+# Patterns used by the parsers, compiled once at import
+_BRACKET_RE = re.compile(r'\[\[(.*?)\]\]', re.IGNORECASE)
+_BRACKET_INTEGER_RE = re.compile(r'\[\[(\d+)\]\]')
+_INTEGER_RE = re.compile(r'\b(\d+)\b')
+_BRACKET_LETTER_RE = re.compile(r'\[\[([a-zA-Z])\]\]')
+_LETTER_RE = re.compile(r'[a-zA-Z]')
+# Wrapper text around unbracketed content: a leading "Here's my poem:" style
+# preamble or trailing commentary, stripped together in a single scan
+_CONTENT_WRAPPER_RE = re.compile(
+    r'^(here\'?s?\s+(my|a)\s+\w+[\s\:]+)'
+    r'|(\n\n.*explanation.*$|\n\n.*hope you.*$|\n\n.*enjoy.*$)',
+    re.IGNORECASE
+)
+_PLAYER_ID_RE = re.compile(r'\b(player_\d+)\b', re.IGNORECASE)
+
+def _find_bracketed(response, multiline=False):
+    """
+    Find the content of the first [[...]] in a response.
+
+    Uses plain substring search, only falling back to the regex when the
+    first candidate spans a line break and multiline matches aren't allowed.
+
+    Args:
+        response (str): The LLM's response
+        multiline (bool): Whether the bracketed content may span lines
+
+    Returns:
+        str: The bracketed content, or None if there is none
+    """
+    start = response.find('[[')
+    if start == -1:
+        return None
+    end = response.find(']]', start + 2)
+    if end == -1:
+        return None
+
+    content = response[start + 2:end]
+    if multiline or '\n' not in content:
+        return content
+
+    match = _BRACKET_RE.search(response)
+    return match.group(1) if match else None
+
 class ResponseParserRegistry:
     """
     Registry for response parsers.
@@ -47,7 +90,7 @@ class ResponseParserRegistry:
         if name not in cls._parsers:
             # Fall back to default parser if specific one not found
             if 'default_parser' in cls._parsers:
-                logger.warning(f"Parser '{name}' not found, using default_parser")
+                logger.warning("Parser '%s' not found, using default_parser", name)
                 return cls._parsers['default_parser']()
             raise ValueError(f"No parser registered for '{name}'")
         return cls._parsers[name]()
@@ -74,7 +117,7 @@ class ChoiceParser:
         Returns:
             str: The parsed choice
         """
-        logger.debug(f"Parsing choice response: {response[:50]}...")
+        logger.debug("Parsing choice response: %s...", response[:50])
 
         # Get valid options from phase config
         options = []
@@ -83,32 +126,32 @@ class ChoiceParser:
             if 'options' in action:
                 options = [opt.lower() for opt in action['options']]
 
-        logger.debug(f"Valid options: {options}")
+        logger.debug("Valid options: %s", options)
 
         # First, look for choices in double brackets [[CHOICE]]
-        bracket_matches = re.findall(r'\[\[(.*?)\]\]', response, re.IGNORECASE)
+        bracketed = _find_bracketed(response)
 
-        if bracket_matches:
+        if bracketed is not None:
             # Get the first bracketed choice
-            bracketed_choice = bracket_matches[0].strip().lower()
-            logger.debug(f"Found bracketed choice: {bracketed_choice}")
+            bracketed_choice = bracketed.strip().lower()
+            logger.debug("Found bracketed choice: %s", bracketed_choice)
 
-            # Check if the bracketed choice matches any valid option
+            # Most responses name an option exactly; check that before scanning
+            if bracketed_choice in options:
+                logger.info("Exact match for bracketed choice: %s", bracketed_choice)
+                return bracketed_choice
+
+            # Otherwise check if the bracketed choice contains any valid option
             for option in options:
                 if option in bracketed_choice:
-                    logger.info(f"Matched bracketed choice to option: {option}")
+                    logger.info("Matched bracketed choice to option: %s", option)
                     return option
 
-            # If brackets found but no valid option matched, try exact match
-            if bracketed_choice in options:
-                logger.info(f"Exact match for bracketed choice: {bracketed_choice}")
-                return bracketed_choice
-
-            logger.warning(f"Bracketed choice '{bracketed_choice}' didn't match any valid option")
+            logger.warning("Bracketed choice '%s' didn't match any valid option", bracketed_choice)
 
         # Fail instead of using defaults
         if options:
-            logger.error(f"No option matched in response. Valid options: {options}")
+            logger.error("No option matched in response. Valid options: %s", options)
             raise ValueError(f"Failed to parse a valid choice from response. Options were: {options}")
         else:
             logger.error("No valid options found to choose from")
@@ -159,7 +202,7 @@ class IntegerParser:
         Returns:
             int: The parsed integer, or a default value if none found
         """
-        logger.debug(f"Parsing integer from response: {response[:50]}...")
+        logger.debug("Parsing integer from response: %s...", response[:50])
 
         # Get constraints from phase config
         min_val = 0
@@ -173,30 +216,30 @@ class IntegerParser:
                 max_val = params.get('max', max_val)
 
         # First, check for integers in double brackets
-        bracket_matches = re.findall(r'\[\[(\d+)\]\]', response)
-        if bracket_matches:
-            value = int(bracket_matches[0])
+        bracket_match = _BRACKET_INTEGER_RE.search(response)
+        if bracket_match:
+            value = int(bracket_match.group(1))
             if min_val <= value <= max_val:
-                logger.info(f"Found valid integer in brackets: {value}")
+                logger.info("Found valid integer in brackets: %s", value)
                 return value
             else:
-                logger.error(f"Bracketed integer {value} out of range (min: {min_val}, max: {max_val})")
+                logger.error("Bracketed integer %s out of range (min: %s, max: %s)", value, min_val, max_val)
                 raise ValueError(f"Integer {value} out of range (min: {min_val}, max: {max_val})")
 
         # If no bracketed integers, try to find any integer in the response
-        matches = re.findall(r'\b(\d+)\b', response)
+        matches = _INTEGER_RE.findall(response)
 
         if matches:
             # Get all integers and find the first one in range
             for match in matches:
                 value = int(match)
                 if min_val <= value <= max_val:
-                    logger.info(f"Found valid integer in response: {value}")
+                    logger.info("Found valid integer in response: %s", value)
                     return value
 
             # If no value in range, raise an exception
             value = int(matches[0])
-            logger.error(f"Integer {value} out of range (min: {min_val}, max: {max_val})")
+            logger.error("Integer %s out of range (min: %s, max: %s)", value, min_val, max_val)
             raise ValueError(f"Integer {value} out of range (min: {min_val}, max: {max_val})")
 
         # Raise an exception if no integer found
@@ -225,21 +268,22 @@ class SingleCharacterParser:
         Returns:
             str: The parsed character, or a default if none found
         """
-        logger.debug(f"Parsing single character from response: {response[:50]}...")
+        logger.debug("Parsing single character from response: %s...", response[:50])
 
         # First, check for characters in double brackets
-        bracket_matches = re.findall(r'\[\[([a-zA-Z])\]\]', response)
-        if bracket_matches:
-            logger.info(f"Found character in brackets: {bracket_matches[0]}")
-            return bracket_matches[0].lower()
+        bracket_match = _BRACKET_LETTER_RE.search(response)
+        if bracket_match:
+            char = bracket_match.group(1)
+            logger.info("Found character in brackets: %s", char)
+            return char.lower()
 
-        # If no bracketed character, extract all alphabetic characters
-        chars = re.findall(r'[a-zA-Z]', response)
+        # If no bracketed character, take the first alphabetic character
+        char_match = _LETTER_RE.search(response)
 
-        if chars:
-            # Return the first character
-            logger.info(f"Found character in response: {chars[0]}")
-            return chars[0].lower()
+        if char_match:
+            char = char_match.group(0)
+            logger.info("Found character in response: %s", char)
+            return char.lower()
 
         # Fail if no character found
         logger.error("No alphabetic character found in response")
@@ -265,7 +309,7 @@ class TextParser:
         Returns:
             str: The parsed text
         """
-        logger.debug(f"Parsing text response: {response[:50]}...")
+        logger.debug("Parsing text response: %s...", response[:50])
 
         # Simple cleaning - just trim whitespace
         return response.strip()
@@ -291,15 +335,15 @@ class ContentParser:
         Returns:
             str: The parsed creative content
         """
-        logger.debug(f"Parsing creative content: {response[:50]}...")
+        logger.debug("Parsing creative content: %s...", response[:50])
 
-        # First, look for content in double brackets [[content]]
-        # Use a pattern that can span multiple lines with re.DOTALL
-        bracket_matches = re.findall(r'\[\[(.*?)\]\]', response, re.IGNORECASE | re.DOTALL)
+        # First, look for content in double brackets [[content]],
+        # which may span multiple lines
+        bracketed = _find_bracketed(response, multiline=True)
 
-        if bracket_matches:
+        if bracketed is not None:
             # Get the complete content inside brackets
-            return bracket_matches[0].strip()
+            return bracketed.strip()
 
         # Fallback: If no bracketed content found, use basic cleaning
         logger.warning("No bracketed content found, falling back to basic cleaning")
@@ -307,11 +351,9 @@ class ContentParser:
         # Remove common wrapper text LLMs might add
         content = response.strip()
 
-        # Remove "Here's my poem:" or similar prefixes
-        content = re.sub(r'^(here\'?s?\s+(my|a)\s+\w+[\s\:]+)', '', content, flags=re.IGNORECASE)
-
-        # Remove explanations or commentary after the content
-        content = re.sub(r'(\n\n.*explanation.*$|\n\n.*hope you.*$|\n\n.*enjoy.*$)', '', content, flags=re.IGNORECASE)
+        # Remove "Here's my poem:" or similar prefixes and any explanations
+        # or commentary after the content
+        content = _CONTENT_WRAPPER_RE.sub('', content)
 
         # Return the cleaned content
         return content.strip()
@@ -337,30 +379,30 @@ class VoteParser:
         Returns:
             str: The parsed player ID
         """
-        logger.debug(f"Parsing vote response: {response[:50]}...")
+        logger.debug("Parsing vote response: %s...", response[:50])
 
         # First, look for player IDs in double brackets [[player_id]]
-        bracket_matches = re.findall(r'\[\[(.*?)\]\]', response, re.IGNORECASE)
+        bracketed = _find_bracketed(response)
 
-        if bracket_matches:
+        if bracketed is not None:
             # Get the first bracketed choice
-            bracketed_choice = bracket_matches[0].strip().lower()
-            logger.debug(f"Found bracketed player ID: {bracketed_choice}")
+            bracketed_choice = bracketed.strip().lower()
+            logger.debug("Found bracketed player ID: %s", bracketed_choice)
 
             # Return the bracketed choice as is
             return bracketed_choice
 
         # If no bracketed choice, look for player ID patterns
-        player_id_matches = re.findall(r'\b(player_\d+)\b', response, re.IGNORECASE)
+        player_id_match = _PLAYER_ID_RE.search(response)
 
-        if player_id_matches:
+        if player_id_match:
             # Get the first player ID match
-            player_id = player_id_matches[0].strip().lower()
-            logger.debug(f"Found player ID in text: {player_id}")
+            player_id = player_id_match.group(1).strip().lower()
+            logger.debug("Found player ID in text: %s", player_id)
 
             # Return the player ID
             return player_id
 
         # If no player ID found, return the raw response
-        logger.warning(f"No player ID found in response, returning raw response")
+        logger.warning("No player ID found in response, returning raw response")
         return response.strip()
\ No newline at end of file
@@ -33,7 +33,7 @@ class ProductionLLMClient():
 
     def get_completion(self, prompt, model, system_prompt=None, player_id=None, phase_id=None, round_num=None):
         """Get a completion from the model"""
-        logger.info(f"Sending prompt to {model}")
+        logger.info("Sending prompt to %s", model)
 
         # throw an error if the model is not provided
         if not model:
@@ -77,11 +77,7 @@ class ProductionLLMClient():
             phase_id = game_state.current_phase
 
         # Get phase configuration
-        phase_config = None
-        for phase in game_state.config['phases']:
-            if phase['id'] == phase_id:
-                phase_config = phase
-                break
+        phase_config = game_state.phases_by_id.get(phase_id)
 
         if phase_config is None:
             raise ValueError(f"Phase not found: {phase_id}")
@@ -101,8 +97,7 @@ class ProductionLLMClient():
         system_prompt = game_state.config.get('llm_integration', {}).get('system_prompts', {}).get(phase_id)
 
         # Get model
-        player_models = game_state.config.get('llm_integration', {}).get('player_models', {})
-        model = player_models.get(player['id'])
+        model = game_state.player_models.get(player['id'])
 
         if not model:
             # throw an error if the model is not provided
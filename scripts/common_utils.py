@@ -1,3 +1,53 @@
+import mmap
+import os
+from types import MappingProxyType
+
+import yaml
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# JSONL files at least this large are read through mmap instead of buffered I/O
+MMAP_THRESHOLD = 1024 * 1024
+
+# Provider name mapping
+PROVIDER_NAMES = MappingProxyType({
+    "openai": "OpenAI",
+    "anthropic": "Anthropic",
+    "xai": "xAI",
+    "google": "Google",
+    "deepseek": "DeepSeek",
+    "mistral": "Mistral"
+})
+
+# Model name mapping (only for the model portion)
+MODEL_NAMES = MappingProxyType({
+    # DeepSeek models
+    "deepseek-chat": "V3",
+    "deepseek-reasoner": "R1",
+
+    # OpenAI models
+    "gpt-4o": "GPT-4o",
+    "o3-mini": "O3 Mini",
+    "gpt-4.5-preview": "GPT-4.5",
+    "o1": "O1",
+
+    # Anthropic models
+    "claude-3-5-sonnet-20240620": "Claude 3.5",
+    "claude-3-7-sonnet-20250219": "Claude 3.7",
+
+    # xAI models
+    "grok-2-1212": "Grok-2",
+
+    # Google models
+    "gemini-2.0-flash": "Gemini 2.0",
+    "gemini-2.0-flash-exp": "Gemini 2.0 (Experimental)",
+    "gemini-2.0-flash-thinking-exp-01-21": "Gemini 2.0 Thinking",
+
+    # Mistral models
+    "mistral-large-latest": "Mistral Large"
+})
+
 def extract_model_name(full_model_name):
     """
     Extract a readable model name from provider:model format,
@@ -15,47 +65,10 @@ def extract_model_name(full_model_name):
 
     provider, model_id = full_model_name.split(":", 1)
 
-    # Provider name mapping
-    provider_map = {
-        "openai": "OpenAI",
-        "anthropic": "Anthropic",
-        "xai": "xAI",
-        "google": "Google",
-        "deepseek": "DeepSeek",
-        "mistral": "Mistral"
-    }
-    provider_clean = provider_map.get(provider.lower(), provider.capitalize())
-
-    # Model name mapping (only for the model portion)
-    model_name_map = {
-        # DeepSeek models
-        "deepseek-chat": "V3",
-        "deepseek-reasoner": "R1",
-
-        # OpenAI models
-        "gpt-4o": "GPT-4o",
-        "o3-mini": "O3 Mini",
-        "gpt-4.5-preview": "GPT-4.5",
-        "o1": "O1",
-
-        # Anthropic models
-        "claude-3-5-sonnet-20240620": "Claude 3.5",
-        "claude-3-7-sonnet-20250219": "Claude 3.7",
-
-        # xAI models
-        "grok-2-1212": "Grok-2",
-
-        # Google models
-        "gemini-2.0-flash": "Gemini 2.0",
-        "gemini-2.0-flash-exp": "Gemini 2.0 (Experimental)",
-        "gemini-2.0-flash-thinking-exp-01-21": "Gemini 2.0 Thinking",
-
-        # Mistral models
-        "mistral-large-latest": "Mistral Large"
-    }
+    provider_clean = PROVIDER_NAMES.get(provider.lower(), provider.capitalize())
 
     # Get the friendly model name, or use the original if not in our map
-    friendly_model = model_name_map.get(model_id, model_id)
+    friendly_model = MODEL_NAMES.get(model_id, model_id)
 
     return f"{provider_clean} {friendly_model}"
 
@@ -77,4 +90,37 @@ def get_session_directory(benchmark_dir, session_id):
         timestamp = '_'.join(parts[-2:])
         return '/'.join([benchmark_dir, timestamp])
     # Fallback if format doesn't match expected
-    return '/'.join([benchmark_dir, session_id])
\ No newline at end of file
+    return '/'.join([benchmark_dir, session_id])
+
+def load_yaml(stream):
+    """
+    Safely parse a YAML document using the fastest available loader.
+
+    Args:
+        stream: An open file or a string containing YAML
+
+    Returns:
+        The parsed YAML content
+    """
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+def iter_jsonl_lines(path):
+    """
+    Yield the raw lines of a JSONL file as bytes.
+    Files of MMAP_THRESHOLD bytes or more are memory-mapped so lines are
+    sliced straight from the page cache rather than copied through the
+    buffered reader.
+
+    Args:
+        path (str): Path to the JSONL file
+
+    Yields:
+        bytes: Each line of the file, including its trailing newline
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield from f
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b'')
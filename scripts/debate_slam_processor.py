@@ -5,7 +5,7 @@ import os
 from collections import defaultdict
 import argparse
 from pathlib import Path
-from common_utils import extract_model_name
+from common_utils import extract_model_name, iter_jsonl_lines, load_yaml
 
 def split_events_by_swap(events):
     """Split events into pre-swap and post-swap collections."""
@@ -331,13 +331,12 @@ def process_debate_slam(snapshots_file, player_models=None):
     snapshots = []
     events = []
 
-    with open(snapshots_file, 'r') as f:
-        for line in f:
-            record = json.loads(line)
-            if record.get("record_type") == 'snapshot':
-                snapshots.append(record)
-            elif record.get("record_type") == 'event':
-                events.append(record)
+    for line in iter_jsonl_lines(snapshots_file):
+        record = json.loads(line)
+        if record.get("record_type") == 'snapshot':
+            snapshots.append(record)
+        elif record.get("record_type") == 'event':
+            events.append(record)
 
     # Sort events chronologically
     def safe_event_time(event):
@@ -400,10 +399,9 @@ def process_single_session(session_dir, output_file, verbose=True):
     player_models = None
 
     if os.path.exists(config_file):
-        import yaml
         try:
             with open(config_file, 'r') as f:
-                config = yaml.safe_load(f)
+                config = load_yaml(f)
 
             player_models = {}
             llm_integration = config.get('llm_integration', {})
@@ -1,14 +1,44 @@
 import os
 import json
-import glob
-import yaml  # You'll need to pip install pyyaml if not already installed
+from common_utils import load_yaml
+
+# Serialized record_type markers as written by GameSession, used to skip
+# parsing lines of the wrong record type
+EVENT_MARKER = '"record_type": "event"'
+SNAPSHOT_MARKER = '"record_type": "snapshot"'
+
+def find_results_files(directory):
+    """
+    Recursively find results.json files, skipping hidden directories like glob does.
+
+    Each directory is read once with os.scandir, using the cached entry
+    type instead of a stat call per entry.
+
+    Args:
+        directory (str): Directory to search
+
+    Yields:
+        str: Path to each results.json file
+    """
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                subdirs.append(entry.path)
+            elif entry.name == "results.json":
+                yield entry.path
+
+    for subdir in subdirs:
+        yield from find_results_files(subdir)
 
 def fix_debate_slam_results(root_directory):
     """
     Correct the results.json files for all Debate Slam sessions.
     """
     # Find all results.json files
-    results_files = glob.glob(os.path.join(root_directory, "**/results.json"), recursive=True)
+    results_files = list(find_results_files(root_directory))
 
     for results_path in results_files:
         session_dir = os.path.dirname(results_path)
@@ -34,7 +64,7 @@ def fix_debate_slam_results(root_directory):
         if os.path.exists(config_path):
             try:
                 with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
+                    config = load_yaml(f)
 
                 # Extract from the YAML structure
                 if 'llm_integration' in config and 'player_models' in config['llm_integration']:
@@ -54,8 +84,9 @@ def fix_debate_slam_results(root_directory):
 
         if fixed:
             # Save the updated results
+            results_json = json.dumps(results, indent=2)
             with open(results_path, 'w') as f:
-                json.dump(results, f, indent=2)
+                f.write(results_json)
             print(f"  ✓ Fixed and saved")
         else:
             print(f"  ✗ No changes needed or couldn't fix")
@@ -69,6 +100,8 @@ def extract_history_and_sides(snapshots_path):
     # First find the side assignments from events
     with open(snapshots_path, 'r') as f:
         for line in f:
+            if EVENT_MARKER not in line:
+                continue
             try:
                 data = json.loads(line)
                 if data.get('record_type') == 'event':
@@ -100,6 +133,8 @@ def extract_history_and_sides(snapshots_path):
     sides_info = {}
     with open(snapshots_path, 'r') as f:
         for line in f:
+            if SNAPSHOT_MARKER not in line:
+                continue
             try:
                 data = json.loads(line)
                 if data.get('record_type') == 'snapshot':
@@ -134,6 +169,8 @@ def extract_history_and_sides(snapshots_path):
 
         # Process snapshots in reverse to find the complete history
         for line in reversed(lines):
+            if SNAPSHOT_MARKER not in line:
+                continue
             try:
                 data = json.loads(line)
                 if data.get('record_type') == 'snapshot' and data.get('game_over', False):
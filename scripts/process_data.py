@@ -2,12 +2,13 @@
 # scripts/process_data.py
 import os
 import json
-import yaml
+import re
 import pandas as pd
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from common_utils import extract_model_name, get_session_directory
+from common_utils import extract_model_name, get_session_directory, load_yaml
 
 
 def load_benchmark_log(benchmark_dir):
@@ -22,12 +23,70 @@ def load_benchmark_log(benchmark_dir):
     return logs
 
 
+def load_snapshots(session_dir):
+    """Load the snapshot records (not events) from a session's snapshots.jsonl."""
+    snapshots = []
+    snapshot_path = os.path.join(session_dir, "snapshots.jsonl")
+    if os.path.exists(snapshot_path):
+        with open(snapshot_path, 'r') as f:
+            for line in f:
+                try:
+                    data = json.loads(line)
+                    if data.get("record_type") == "snapshot":
+                        snapshots.append(data)
+                except:
+                    continue
+
+    return snapshots
+
+
+def iter_snapshot_loads(session_dirs, max_workers=8):
+    """
+    Load snapshots for several sessions concurrently, in order.
+
+    At most max_workers loads are submitted ahead of the consumer, so only
+    that many sessions' snapshots are held in memory at once.
+
+    Args:
+        session_dirs: Session directories to load
+        max_workers: Maximum number of reader threads
+
+    Yields:
+        Future: For each session directory in order, resolving to its snapshot list
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for session_dir in session_dirs:
+            pending.append(executor.submit(load_snapshots, session_dir))
+            if len(pending) >= max_workers:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def write_json_files(directory, files):
+    """
+    Write several JSON documents into a directory, one write call per file.
+
+    Args:
+        directory: Directory to write into
+        files: Iterable of (file name, data) pairs
+    """
+    for file_name, data in files:
+        with open(os.path.join(directory, file_name), 'w') as f:
+            f.write(json.dumps(data, indent=2))
+
+
 class GameProcessor:
     """Base class for game-specific processing logic."""
 
+    # Lowercase keywords identifying this processor's game in a session ID
+    keywords = ()
+
     def can_process(self, session_id):
         """Determine if this processor can handle this game type."""
-        return False
+        session_id = session_id.lower()
+        return any(keyword in session_id for keyword in self.keywords)
 
     def generate_leaderboard(self, benchmark_logs, benchmark_dir):
         """Generate leaderboard data for this game type."""
@@ -62,9 +121,7 @@ class GameProcessor:
 class PrisonersDilemmaProcessor(GameProcessor):
     """Processor for Prisoner's Dilemma game."""
 
-    def can_process(self, session_id):
-        """Determine if this processor can handle this game type."""
-        return 'prisoner' in session_id.lower()
+    keywords = ('prisoner',)
 
     def generate_leaderboard(self, benchmark_logs, benchmark_dir):
         """Generate leaderboard data for Prisoner's Dilemma."""
@@ -250,7 +307,7 @@ class PrisonersDilemmaProcessor(GameProcessor):
         """Analyze decisions for Prisoner's Dilemma."""
         # Map model ID to player ID
         with open(os.path.join(session_dir, "game_config.yaml"), 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
 
         player_id = None
         player_models = config.get('llm_integration', {}).get('player_models', {})
@@ -435,7 +492,7 @@ class PrisonersDilemmaProcessor(GameProcessor):
                 if decision == "defect":
                     # Find which model this player_id maps to
                     with open(os.path.join(session_dir, "game_config.yaml"), 'r') as f:
-                        config = yaml.safe_load(f)
+                        config = load_yaml(f)
 
                     player_models = config.get('llm_integration', {}).get('player_models', {})
                     model_id = player_models.get(player_id)
@@ -545,9 +602,7 @@ class PrisonersDilemmaProcessor(GameProcessor):
 class PoetryProcessor(GameProcessor):
     """Processor for Poetry Slam game."""
 
-    def can_process(self, session_id):
-        """Determine if this processor can handle this game type."""
-        return 'poetry' in session_id.lower()
+    keywords = ('poetry',)
 
     def generate_leaderboard(self, benchmark_logs, benchmark_dir):
         """Generate leaderboard data for Poetry Slam."""
@@ -651,7 +706,7 @@ class PoetryProcessor(GameProcessor):
         """Analyze voting decisions for Poetry Slam."""
         # Map model ID to player ID
         with open(os.path.join(session_dir, "game_config.yaml"), 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
 
         player_id = None
         player_models = config.get('llm_integration', {}).get('player_models', {})
@@ -692,11 +747,12 @@ class PoetryProcessor(GameProcessor):
                         continue
 
             # Find the snapshot with voting results
+            voting_snapshot = max((snapshot for snapshot in snapshots
+                                   if 'voting_responses' in snapshot.get('shared_state', {})),
+                                  key=lambda x: x.get('snapshot_id', 0), default=None)
             voting_results = None
-            for snapshot in sorted(snapshots, key=lambda x: x.get('snapshot_id', 0), reverse=True):
-                if 'voting_responses' in snapshot.get('shared_state', {}):
-                    voting_results = snapshot.get('shared_state', {}).get('voting_responses', {})
-                    break
+            if voting_snapshot is not None:
+                voting_results = voting_snapshot.get('shared_state', {}).get('voting_responses', {})
 
             if voting_results:
                 # Get this player's vote
@@ -841,9 +897,7 @@ class PoetryProcessor(GameProcessor):
 class DebateProcessor(GameProcessor):
     """Processor for Debate Slam games."""
 
-    def can_process(self, session_id):
-        """Determine if this processor can handle this game type."""
-        return 'debate' in session_id.lower() or 'slam' in session_id.lower()
+    keywords = ('debate', 'slam')
 
     def generate_leaderboard(self, benchmark_logs, benchmark_dir):
         """Generate leaderboard data for Debate Slam."""
@@ -925,9 +979,12 @@ class DebateProcessor(GameProcessor):
         positions = set()
         vote_data = {}
 
-        for game in benchmark_logs:
+        snapshot_loads = iter_snapshot_loads(
+            get_session_directory(benchmark_dir, game.get('session_id', '')) for game in benchmark_logs
+        )
+
+        for game, snapshot_load in zip(benchmark_logs, snapshot_loads):
             session_id = game.get('session_id', '')
-            session_dir = get_session_directory(benchmark_dir, session_id)
 
             # Map player IDs to models
             player_models = {}
@@ -944,24 +1001,12 @@ class DebateProcessor(GameProcessor):
 
             # Load snapshots to get voting data
             try:
-                snapshots = []
-                snapshot_path = os.path.join(session_dir, "snapshots.jsonl")
-                if os.path.exists(snapshot_path):
-                    with open(snapshot_path, 'r') as f:
-                        for line in f:
-                            try:
-                                data = json.loads(line)
-                                if data.get("record_type") == "snapshot":
-                                    snapshots.append(data)
-                            except:
-                                continue
+                snapshots = snapshot_load.result()
 
                 # Find final snapshot with judge opinions
-                final_snapshot = None
-                for snapshot in sorted(snapshots, key=lambda x: x.get('snapshot_id', 0), reverse=True):
-                    if snapshot.get('shared_state', {}).get('judge_opinions'):
-                        final_snapshot = snapshot
-                        break
+                final_snapshot = max((snapshot for snapshot in snapshots
+                                      if snapshot.get('shared_state', {}).get('judge_opinions')),
+                                     key=lambda x: x.get('snapshot_id', 0), default=None)
 
                 if final_snapshot:
                     # Extract sides/positions
@@ -1076,9 +1121,12 @@ class DebateProcessor(GameProcessor):
             session_id = game.get('session_id', '')
             session_dir = get_session_directory(benchmark_dir, session_id)
 
-            # Get game topic and sides from snapshots
+            # Scan the snapshots once for the game topic and sides and for the
+            # latest snapshot, which holds the judges' votes
             debate_topic = ""
             sides = []
+            topic_found = False
+            final_snapshot = None
             try:
                 snapshot_path = os.path.join(session_dir, "snapshots.jsonl")
                 if os.path.exists(snapshot_path):
@@ -1087,10 +1135,13 @@ class DebateProcessor(GameProcessor):
                             try:
                                 data = json.loads(line)
                                 if data.get("record_type") == "snapshot":
-                                    debate_topic = data.get('shared_state', {}).get('debate_topic', '')
-                                    sides = data.get('shared_state', {}).get('sides', [])
-                                    if debate_topic and sides:
-                                        break
+                                    if (final_snapshot is None or
+                                            data.get('snapshot_id', 0) > final_snapshot.get('snapshot_id', 0)):
+                                        final_snapshot = data
+                                    if not topic_found:
+                                        debate_topic = data.get('shared_state', {}).get('debate_topic', '')
+                                        sides = data.get('shared_state', {}).get('sides', [])
+                                        topic_found = bool(debate_topic and sides)
                             except:
                                 continue
             except:
@@ -1135,23 +1186,9 @@ class DebateProcessor(GameProcessor):
                             'total_score': final_state.get('score', 0)
                         })
                     elif role == 'judge' and model_id in judge_profiles:
-                        # Find this judge's voting pattern from snapshots
+                        # Find this judge's voting pattern from the latest snapshot
                         try:
-                            snapshots = []
-                            snapshot_path = os.path.join(session_dir, "snapshots.jsonl")
-                            if os.path.exists(snapshot_path):
-                                with open(snapshot_path, 'r') as f:
-                                    for line in f:
-                                        try:
-                                            data = json.loads(line)
-                                            if data.get("record_type") == "snapshot":
-                                                snapshots.append(data)
-                                        except:
-                                            continue
-
-                            # Get the last snapshot
-                            if snapshots:
-                                final_snapshot = max(snapshots, key=lambda x: x.get('snapshot_id', 0))
+                            if final_snapshot is not None:
                                 judge_opinions = final_snapshot.get('shared_state', {}).get('judge_opinions', {})
 
                                 # Get judge votes by round
@@ -1286,11 +1323,9 @@ class DebateProcessor(GameProcessor):
                         snapshots.append(data)
 
             # Find final snapshot with complete judge opinions
-            final_snapshot = None
-            for snapshot in sorted(snapshots, key=lambda x: x.get('snapshot_id', 0), reverse=True):
-                if snapshot.get('shared_state', {}).get('judge_opinions'):
-                    final_snapshot = snapshot
-                    break
+            final_snapshot = max((snapshot for snapshot in snapshots
+                                  if snapshot.get('shared_state', {}).get('judge_opinions')),
+                                 key=lambda x: x.get('snapshot_id', 0), default=None)
 
             if not final_snapshot:
                 continue
@@ -1402,12 +1437,20 @@ class GameProcessorFactory:
             DebateProcessor(),
         ]
 
+        # One alternation over every processor's keywords, so a session ID is
+        # scanned once; each keyword maps to its processor's priority
+        self.keyword_priority = {}
+        for priority, processor in enumerate(self.processors):
+            for keyword in processor.keywords:
+                self.keyword_priority.setdefault(keyword, priority)
+        self.keyword_re = re.compile('|'.join(map(re.escape, self.keyword_priority)), re.IGNORECASE)
+
     def get_processor(self, session_id):
         """Get the appropriate processor for the game type."""
-        for processor in self.processors:
-            if processor.can_process(session_id):
-                return processor
-        return None
+        matches = self.keyword_re.findall(session_id)
+        if not matches:
+            return None
+        return self.processors[min(self.keyword_priority[match.lower()] for match in matches)]
 
 
 def process_benchmark(benchmark_dir, output_dir="data/processed"):
@@ -1450,23 +1493,12 @@ def process_benchmark(benchmark_dir, output_dir="data/processed"):
     round_progression = processor.analyze_round_progression(benchmark_logs, benchmark_dir)
 
     # Create output directory
-    os.makedirs(os.path.join(output_dir, benchmark_id), exist_ok=True)
-
-    # Save processed data
-    with open(os.path.join(output_dir, benchmark_id, "leaderboard.json"), 'w') as f:
-        json.dump(leaderboard, f, indent=2)
-
-    with open(os.path.join(output_dir, benchmark_id, "matchup_matrix.json"), 'w') as f:
-        json.dump(matchup_matrix, f, indent=2)
-
-    with open(os.path.join(output_dir, benchmark_id, "model_profiles.json"), 'w') as f:
-        json.dump(model_profiles, f, indent=2)
-
-    with open(os.path.join(output_dir, benchmark_id, "round_progression.json"), 'w') as f:
-        json.dump(round_progression, f, indent=2)
+    benchmark_output_dir = os.path.join(output_dir, benchmark_id)
+    os.makedirs(benchmark_output_dir, exist_ok=True)
 
     # Generate metadata
-    game_type = 'debate_slam' if 'debate' in benchmark_id.lower() else 'poetry_slam' if 'poetry' in benchmark_id.lower() else 'prisoners_dilemma'
+    benchmark_name = benchmark_id.lower()
+    game_type = 'debate_slam' if 'debate' in benchmark_name else 'poetry_slam' if 'poetry' in benchmark_name else 'prisoners_dilemma'
 
     if game_type in ['poetry_slam', 'debate_slam']:
         # Count unique models across all games
@@ -1488,10 +1520,16 @@ def process_benchmark(benchmark_dir, output_dir="data/processed"):
         "processed_at": pd.Timestamp.now().isoformat(),
     }
 
-    with open(os.path.join(output_dir, benchmark_id, "metadata.json"), 'w') as f:
-        json.dump(metadata, f, indent=2)
+    # Save processed data and metadata in a single pass
+    write_json_files(benchmark_output_dir, [
+        ("leaderboard.json", leaderboard),
+        ("matchup_matrix.json", matchup_matrix),
+        ("model_profiles.json", model_profiles),
+        ("round_progression.json", round_progression),
+        ("metadata.json", metadata),
+    ])
 
-    print(f"Processing complete! Data saved to {os.path.join(output_dir, benchmark_id)}")
+    print(f"Processing complete! Data saved to {benchmark_output_dir}")
     return metadata
 
 
@@ -1507,10 +1545,10 @@ def process_all_benchmarks(data_dir="data", output_dir="data/processed"):
 
     # List all benchmark directories
     benchmarks = []
-    for item in os.listdir(benchmark_dir):
-        full_path = os.path.join(benchmark_dir, item)
-        if os.path.isdir(full_path) and os.path.exists(os.path.join(full_path, "benchmark_log.jsonl")):
-            benchmarks.append(full_path)
+    with os.scandir(benchmark_dir) as it:
+        for entry in it:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "benchmark_log.jsonl")):
+                benchmarks.append(entry.path)
 
     print(f"Found {len(benchmarks)} benchmarks to process")
 
@@ -2,13 +2,28 @@
 # scripts/process_game_detail.py
 import os
 import json
-import yaml
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from common_utils import extract_model_name
+from common_utils import extract_model_name, iter_jsonl_lines, load_yaml
 
 from debate_slam_processor import process_single_session as process_debate_session
 
+# Game keywords that mark a full session ID, matched in a single pass
+GAME_KEYWORD_RE = re.compile(r'prisoner|ghost|poetry|slam', re.IGNORECASE)
+
+# Output directories already created by this process
+_created_dirs = set()
+
+
+def ensure_dir(path):
+    """Create a directory once per process, skipping repeat makedirs calls."""
+    if path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
 
 def parse_timestamp(timestamp_str):
     """Convert ISO timestamp to readable format."""
@@ -19,6 +34,23 @@ def parse_timestamp(timestamp_str):
         return timestamp_str
 
 
+def list_session_files(session_dir):
+    """
+    List the names of the files in a session directory with a single directory read.
+
+    Args:
+        session_dir: Path to the session directory
+
+    Returns:
+        set: Names of the files in the directory, empty if it doesn't exist
+    """
+    try:
+        with os.scandir(session_dir) as it:
+            return {entry.name for entry in it if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
 def load_chat_logs(session_dir):
     """Load chat logs from a session directory."""
     chat_logs = []
@@ -38,7 +70,7 @@ def load_chat_logs(session_dir):
     except:
         return {}
 
-    # Organize by player, phase, and round for easy lookup
+    # Index by (player, phase, round) for single-lookup access
     organized_logs = {}
     for log in chat_logs:
         player_id = log.get('player_id')
@@ -48,14 +80,8 @@ def load_chat_logs(session_dir):
         if not player_id or not phase_id:
             continue
 
-        if player_id not in organized_logs:
-            organized_logs[player_id] = {}
-
-        if phase_id not in organized_logs[player_id]:
-            organized_logs[player_id][phase_id] = {}
-
         key = str(round_num) if round_num is not None else "unknown"
-        organized_logs[player_id][phase_id][key] = log
+        organized_logs[(player_id, phase_id, key)] = log
 
     return organized_logs
 
@@ -63,9 +89,16 @@ def load_chat_logs(session_dir):
 class GameDetailGenerator:
     """Base class for game detail timeline generation."""
 
+    # Lowercase keywords identifying this generator's game in the game name
+    keywords = ()
+
     def can_process(self, config):
         """Determine if this generator can process this game type."""
-        return False
+        return self.matches_game_name(config.get('game', {}).get('name', '').lower())
+
+    def matches_game_name(self, game_name):
+        """Determine if an already lowercased game name belongs to this generator."""
+        return any(keyword in game_name for keyword in self.keywords)
 
     def generate_timeline(self, session_dir, config, results, chat_logs, snapshots, events, player_models):
         """Generate timeline for the game."""
@@ -75,10 +108,7 @@ class GameDetailGenerator:
 class PrisonersDilemmaDetailGenerator(GameDetailGenerator):
     """Detail generator for Prisoner's Dilemma game."""
 
-    def can_process(self, config):
-        """Determine if this generator can process this game type."""
-        game_name = config.get('game', {}).get('name', '')
-        return 'prisoner' in game_name.lower()
+    keywords = ('prisoner',)
 
     def get_decision_context(self, decision):
         """Get UI context for a decision."""
@@ -181,11 +211,10 @@ class PrisonersDilemmaDetailGenerator(GameDetailGenerator):
                             }
 
                             # Add reasoning from chat logs if available
-                            if player_id in chat_logs and 'decision' in chat_logs[player_id]:
-                                if round_key in chat_logs[player_id]['decision']:
-                                    chat_log = chat_logs[player_id]['decision'][round_key]
-                                    reasoning = chat_log.get('response', '')
-                                    player_actions[player_id]["reasoning"] = reasoning
+                            chat_log = chat_logs.get((player_id, 'decision', round_key))
+                            if chat_log is not None:
+                                reasoning = chat_log.get('response', '')
+                                player_actions[player_id]["reasoning"] = reasoning
 
                 # Add player actions to timeline
                 for player_id, action_data in player_actions.items():
@@ -251,13 +280,9 @@ class PrisonersDilemmaDetailGenerator(GameDetailGenerator):
                                 running_scores[player_id] = score
 
                         # Extract decisions from history
-                        decisions = {}
                         decision_history = snapshot_after.get('history_state', {}).get('decision_history', [])
-
-                        for history_entry in decision_history:
-                            if history_entry.get('round') == round_num:
-                                decisions = history_entry.get('decisions', {})
-                                break
+                        decisions = next((entry.get('decisions', {}) for entry in decision_history
+                                          if entry.get('round') == round_num), {})
 
                         # Enhance the decisions with context
                         decisions_with_context = {}
@@ -297,10 +322,7 @@ class PrisonersDilemmaDetailGenerator(GameDetailGenerator):
 class PoetryDetailGenerator(GameDetailGenerator):
     """Detail generator for Poetry Slam game."""
 
-    def can_process(self, config):
-        """Determine if this generator can process this game type."""
-        game_name = config.get('game', {}).get('name', '')
-        return 'poetry' in game_name.lower()
+    keywords = ('poetry',)
 
     def get_decision_context(self, decision):
         """Get UI context for a Poetry Slam decision (voting)."""
@@ -379,10 +401,9 @@ class PoetryDetailGenerator(GameDetailGenerator):
 
                             # Get the prompt text from chat logs if available
                             prompt_text = action
-                            if player_id in chat_logs and 'prompt_creation' in chat_logs[player_id]:
-                                if round_key in chat_logs[player_id]['prompt_creation']:
-                                    chat_log = chat_logs[player_id]['prompt_creation'][round_key]
-                                    prompt_text = chat_log.get('response', action)
+                            chat_log = chat_logs.get((player_id, 'prompt_creation', round_key))
+                            if chat_log is not None:
+                                prompt_text = chat_log.get('response', action)
 
                             timeline.append({
                                 "type": "prompt_creation",
@@ -439,10 +460,9 @@ class PoetryDetailGenerator(GameDetailGenerator):
 
                             # Get the full poem from chat logs if available
                             poem_text = action
-                            if player_id in chat_logs and 'content_creation' in chat_logs[player_id]:
-                                if round_key in chat_logs[player_id]['content_creation']:
-                                    chat_log = chat_logs[player_id]['content_creation'][round_key]
-                                    poem_text = chat_log.get('response', action)
+                            chat_log = chat_logs.get((player_id, 'content_creation', round_key))
+                            if chat_log is not None:
+                                poem_text = chat_log.get('response', action)
 
                             timeline.append({
                                 "type": "poem_submission",
@@ -503,10 +523,9 @@ class PoetryDetailGenerator(GameDetailGenerator):
 
                             # Get reasoning from chat logs if available
                             reasoning = ""
-                            if player_id in chat_logs and 'voting' in chat_logs[player_id]:
-                                if round_key in chat_logs[player_id]['voting']:
-                                    chat_log = chat_logs[player_id]['voting'][round_key]
-                                    reasoning = chat_log.get('response', "")
+                            chat_log = chat_logs.get((player_id, 'voting', round_key))
+                            if chat_log is not None:
+                                reasoning = chat_log.get('response', "")
 
                             timeline.append({
                                 "type": "player_vote",
@@ -640,8 +659,10 @@ class GameDetailGeneratorFactory:
 
     def get_generator(self, config):
         """Get the appropriate generator for the game type."""
+        # Lowercase the game name once for all generators
+        game_name = config.get('game', {}).get('name', '').lower()
         for generator in self.generators:
-            if generator.can_process(config):
+            if generator.matches_game_name(game_name):
                 return generator
         return None
 
@@ -656,14 +677,16 @@ def generate_game_timeline(session_dir):
     Returns:
         dict: Detailed game timeline with events
     """
+    session_files = list_session_files(session_dir)
+
     # Load game config to get player models
     config_path = os.path.join(session_dir, "game_config.yaml")
-    if not os.path.exists(config_path):
+    if "game_config.yaml" not in session_files:
         return {"error": f"Game config not found in {session_dir}"}
 
     try:
         with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml(f)
     except:
         return {"error": f"Failed to parse game config in {session_dir}"}
 
@@ -678,7 +701,7 @@ def generate_game_timeline(session_dir):
 
     # Load final results
     results_path = os.path.join(session_dir, "results.json")
-    if not os.path.exists(results_path):
+    if "results.json" not in session_files:
         return {"error": f"Results not found in {session_dir}"}
 
     try:
@@ -692,23 +715,22 @@ def generate_game_timeline(session_dir):
 
     # Load snapshots and events from snapshots.jsonl
     snapshots_path = os.path.join(session_dir, "snapshots.jsonl")
-    if not os.path.exists(snapshots_path):
+    if "snapshots.jsonl" not in session_files:
         return {"error": f"Snapshots not found in {session_dir}"}
 
     snapshots = []
     events = []
 
     try:
-        with open(snapshots_path, 'r') as f:
-            for line in f:
-                try:
-                    record = json.loads(line)
-                    if record.get("record_type") == 'snapshot':
-                        snapshots.append(record)
-                    elif record.get("record_type") == 'event':
-                        events.append(record)
-                except:
-                    continue
+        for line in iter_jsonl_lines(snapshots_path):
+            try:
+                record = json.loads(line)
+                if record.get("record_type") == 'snapshot':
+                    snapshots.append(record)
+                elif record.get("record_type") == 'event':
+                    events.append(record)
+            except:
+                continue
     except:
         return {"error": f"Failed to parse snapshots in {session_dir}"}
 
@@ -801,7 +823,7 @@ def process_game_detail(benchmark_dir, session_id, output_dir="data/processed"):
         session_id = os.path.basename(session_dir)
     else:
         # Check if this is a timestamp-only ID or a full session ID
-        if '_' in session_id and not any(game in session_id.lower() for game in ['prisoner', 'ghost', 'poetry', 'slam']):
+        if '_' in session_id and not GAME_KEYWORD_RE.search(session_id):
             # This is likely just the timestamp portion (e.g., 20250311_144154)
             session_dir = os.path.join(benchmark_dir, session_id)
         else:
@@ -822,7 +844,7 @@ def process_game_detail(benchmark_dir, session_id, output_dir="data/processed"):
 
     # Create output directory
     detail_dir = os.path.join(output_dir, benchmark_id, "detail")
-    os.makedirs(detail_dir, exist_ok=True)
+    ensure_dir(detail_dir)
 
     # Output file path
     output_file = os.path.join(detail_dir, f"{os.path.basename(session_dir)}.json")
@@ -836,35 +858,43 @@ def process_game_detail(benchmark_dir, session_id, output_dir="data/processed"):
         # Standard processing for non-debate games or if debate processor failed
         timeline_data = generate_game_timeline(session_dir)
 
-    # Save detail data
+    # Save detail data, serialized up front so the file is written in one call
+    timeline_json = json.dumps(timeline_data, indent=2)
     with open(output_file, 'w') as f:
-        json.dump(timeline_data, f, indent=2)
+        f.write(timeline_json)
 
     print(f"Game detail processed and saved to {output_file}")
     return output_file
 
 
-def process_all_games(benchmark_dir, output_dir="data/processed"):
+def process_all_games(benchmark_dir, output_dir="data/processed", workers=1):
     """
     Process all game sessions in a benchmark to generate detailed visualization data.
 
+    Sessions are independent, so they can be processed in parallel worker processes.
+
     Args:
         benchmark_dir: Path to benchmark directory
         output_dir: Output directory for processed data
+        workers: Number of worker processes (1, the default, processes serially)
     """
     print(f"Processing all games in benchmark: {benchmark_dir}")
 
     # Get all session directories
     sessions = []
-    for item in os.listdir(benchmark_dir):
-        session_dir = os.path.join(benchmark_dir, item)
-        if os.path.isdir(session_dir) and os.path.exists(os.path.join(session_dir, "results.json")):
-            sessions.append(session_dir)
+    with os.scandir(benchmark_dir) as it:
+        for entry in it:
+            if entry.is_dir() and os.path.exists(os.path.join(entry.path, "results.json")):
+                sessions.append(entry.path)
 
     print(f"Found {len(sessions)} game sessions to process")
 
-    for session_dir in sessions:
-        process_game_detail(benchmark_dir, session_dir, output_dir)
+    if workers <= 1 or len(sessions) <= 1:
+        for session_dir in sessions:
+            process_game_detail(benchmark_dir, session_dir, output_dir)
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(sessions))) as executor:
+            list(executor.map(process_game_detail, repeat(benchmark_dir), sessions, repeat(output_dir)))
 
     print(f"All game sessions processed!")
 
@@ -877,12 +907,13 @@ if __name__ == "__main__":
     parser.add_argument("--session", help="Process a specific session (directory name or ID)")
     parser.add_argument("--all", action="store_true", help="Process all sessions in the benchmark")
     parser.add_argument("--output", default="data/processed", help="Output directory for processed data")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes for --all (default: 1, serial)")
 
     args = parser.parse_args()
 
     if args.session:
         process_game_detail(args.benchmark, args.session, args.output)
     elif args.all:
-        process_all_games(args.benchmark, args.output)
+        process_all_games(args.benchmark, args.output, args.workers)
     else:
         print("Please specify either --session or --all")
\ No newline at end of file
@@ -1,7 +1,5 @@
 import pytest
 import os
-import yaml
-import glob
 import uuid
 import logging
 from unittest.mock import patch
@@ -14,6 +12,7 @@ sys.path.insert(0, project_root)
 # Import our mock utilities
 from tests.mock.random_patch import DeterministicRandom
 from tests.mock.time_patch import DeterministicTime
+from core.game.config import load_yaml_file
 
 # Configure logging
 logging.basicConfig(
@@ -42,12 +41,23 @@ def pytest_addoption(parser):
         default=None,
         help="Run tests for a specific game configuration"
     )
+    parser.addoption(
+        "--fast-fail",
+        action="store_true",
+        default=False,
+        help="Stop validating a test at its first failed assertion (also enabled by PARLOURBENCH_FAIL_FAST=1)"
+    )
 
 @pytest.fixture
 def update_snapshots(request):
     """Fixture that returns whether we should update snapshots"""
     return request.config.getoption("--update-snapshots")
 
+@pytest.fixture
+def fast_fail(request):
+    """Fixture that returns whether validation should stop at the first failure"""
+    return request.config.getoption("--fast-fail") or os.environ.get("PARLOURBENCH_FAIL_FAST") == "1"
+
 @pytest.fixture
 def benchmark_filter(request):
     """Fixture that returns the benchmark filter if specified"""
@@ -116,8 +126,7 @@ def mock_llm(request):
     # Load the test configuration
     try:
         if isinstance(request.param, str):
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+            config = load_yaml_file(config_path)
         else:
             config = request.param
 
@@ -159,27 +168,29 @@ def mock_llm(request):
         logger.error(f"Failed to set up mock aisuite: {str(e)}")
         raise
 
-def load_test_configs(directory_pattern):
+def load_test_configs(test_data_dir):
     """
-    Load all test configurations matching the pattern.
+    Load all test configurations in the test directories under a directory.
 
     Args:
-        directory_pattern (str): Pattern to match test directories
+        test_data_dir (str): Directory containing one subdirectory per test
 
     Returns:
-        list: List of test configuration paths
+        list: List of test configuration paths, sorted by test directory name
     """
-    # Get absolute path for pattern
-    abs_pattern = os.path.join(project_root, directory_pattern)
-    test_dirs = glob.glob(abs_pattern)
+    abs_dir = os.path.join(project_root, test_data_dir)
+    if not os.path.isdir(abs_dir):
+        return []
 
     configs = []
-    for test_dir in test_dirs:
-        config_path = os.path.join(test_dir, "test_config.yaml")
-        if os.path.exists(config_path):
-            configs.append(config_path)
+    with os.scandir(abs_dir) as it:
+        for entry in it:
+            if entry.is_dir() and not entry.name.startswith('.'):
+                config_path = os.path.join(entry.path, "test_config.yaml")
+                if os.path.exists(config_path):
+                    configs.append(config_path)
 
-    return configs
+    return sorted(configs)
 
 def pytest_generate_tests(metafunc):
     """
@@ -194,24 +205,26 @@ def pytest_generate_tests(metafunc):
         game_filter = metafunc.config.getoption("--game")
 
         # Load benchmark configs
-        benchmark_configs = load_test_configs("tests/test_data/benchmarks/*")
+        benchmark_configs = load_test_configs("tests/test_data/benchmarks")
 
         # Load game configs
-        game_configs = load_test_configs("tests/test_data/games/*")
+        game_configs = load_test_configs("tests/test_data/games")
 
         all_configs = []
 
         # Apply filters to benchmarks
         if benchmark_filter:
+            benchmark_filter = benchmark_filter.lower()
             filtered_benchmarks = [
                 config for config in benchmark_configs
-                if benchmark_filter.lower() in config.lower()
+                if benchmark_filter in config.lower()
             ]
             all_configs.extend(filtered_benchmarks)
         elif game_filter:
+            game_filter = game_filter.lower()
             filtered_games = [
                 config for config in game_configs
-                if game_filter.lower() in config.lower()
+                if game_filter in config.lower()
             ]
             all_configs.extend(filtered_games)
         else:
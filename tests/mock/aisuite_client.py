@@ -1,60 +1,99 @@
 import os
 import yaml
 import logging
+from itertools import cycle
+
+from core.game.config import SafeLoader
 
 logger = logging.getLogger("MockAISuiteClient")
 
+# Parsed responses per response file, keyed by the file's path and mtime
+# so edits invalidate the entry
+_RESPONSE_CACHE = {}
+
 class MockMessage:
+    __slots__ = ('content',)
+
     def __init__(self, content):
         self.content = content
 
 class MockChoice:
+    __slots__ = ('message',)
+
     def __init__(self, content):
         self.message = MockMessage(content)
 
 class MockResponse:
+    __slots__ = ('choices',)
+
     def __init__(self, content):
         self.choices = [MockChoice(content)]
 
 class MockCompletions:
+    # Fallback responses for models without usable responses; callers only
+    # read from responses, so one shared instance of each is enough
+    NO_RESPONSE = MockResponse("No response configured for this model.")
+    EMPTY_RESPONSE = MockResponse("Empty response list for this model.")
+
     def __init__(self, response_dir):
         self.response_dir = response_dir
         self.model_responses = {}  # Maps model name to list of responses
-        self.current_indices = {}  # Tracks which response index to use for each model
+        self.response_cycles = {}  # Endless (index, response) iterator for each model
+        self.response_files = {}  # Maps model name to its not yet loaded response file
 
-        # Load all model response files
-        self._load_response_files()
+        # Index model response files; each is parsed on first use of its model
+        self._index_response_files()
 
-    def _load_response_files(self):
-        """Load all model response files from the response directory"""
-        if not os.path.exists(self.response_dir):
+    def _index_response_files(self):
+        """Map each model to its response file in the response directory"""
+        try:
+            with os.scandir(self.response_dir) as it:
+                response_files = [entry for entry in it
+                                  if entry.name.endswith('.yaml') and entry.is_file()]
+        except FileNotFoundError:
             logger.warning(f"Response directory does not exist: {self.response_dir}")
             return
 
-        for file_name in os.listdir(self.response_dir):
-            if file_name.endswith('.yaml'):
-                file_path = os.path.join(self.response_dir, file_name)
-                self._load_response_file(file_path)
+        for entry in response_files:
+            model = self._peek_model(entry.path)
+            if model:
+                self.response_files[model] = (entry.path, entry.stat().st_mtime_ns)
+            else:
+                # Fall back to a full parse if the model can't be read cheaply
+                self._load_response_file(entry.path, entry.stat().st_mtime_ns)
 
-    def _load_response_file(self, file_path):
-        """Load responses from a single YAML file"""
+    def _peek_model(self, file_path):
+        """Read the top-level 'model' field of a response file without parsing the responses"""
         try:
             with open(file_path, 'r') as f:
-                config = yaml.safe_load(f)
+                for line in f:
+                    if line.startswith('model:'):
+                        return yaml.load(line, Loader=SafeLoader).get('model')
+        except Exception as e:
+            logger.debug(f"Could not read model from {file_path}: {str(e)}")
+        return None
 
-            model = config.get('model')
+    def _load_response_file(self, file_path, mtime_ns):
+        """Load responses from a single YAML file"""
+        try:
+            cache_key = (os.path.abspath(file_path), mtime_ns)
+            cached = _RESPONSE_CACHE.get(cache_key)
+            if cached is None:
+                with open(file_path, 'r') as f:
+                    config = yaml.load(f, Loader=SafeLoader)
+                cached = (config.get('model'), list(config.get('responses', [])))
+                _RESPONSE_CACHE[cache_key] = cached
+
+            model, responses = cached
             if not model:
                 logger.warning(f"Response file {file_path} missing 'model' field")
                 return
 
-            responses = []
-            for resp in config.get('responses', []):
-                responses.append(resp)
-
             if responses:
                 self.model_responses[model] = responses
-                self.current_indices[model] = 0
-                logger.info(f"Loaded {len(responses)} responses for model {model} from {file_path}")
+                # Wrap each response once and hand out the same objects on every cycle
+                self.response_cycles[model] = cycle(enumerate(MockResponse(r) for r in responses))
+                logger.debug("Loaded %d responses for model %s from %s", len(responses), model, file_path)
             else:
                 logger.warning(f"No valid responses found in {file_path}")
 
@@ -63,25 +102,24 @@ class MockCompletions:
 
     def create(self, model, messages, temperature=0.7, **kwargs):
         """Mock the create method for getting completions"""
+        # Load this model's responses on first use
+        if model in self.response_files:
+            self._load_response_file(*self.response_files.pop(model))
+
         # Check if we have responses for this model
         if model not in self.model_responses:
             logger.warning(f"No responses configured for model {model}, using default response")
-            return MockResponse("No response configured for this model.")
+            return self.NO_RESPONSE
 
-        responses = self.model_responses[model]
-        if not responses:
+        if not self.model_responses[model]:
             logger.warning(f"Empty response list for model {model}")
-            return MockResponse("Empty response list for this model.")
-
-        # Get the next response
-        current_index = self.current_indices[model]
-        response = responses[current_index % len(responses)]
+            return self.EMPTY_RESPONSE
 
-        # Increment index for next call
-        self.current_indices[model] = current_index + 1
+        # Get the next response, wrapping around at the end of the list
+        index, response = next(self.response_cycles[model])
 
-        logger.info(f"Returning response {current_index % len(responses)} for model {model}")
-        return MockResponse(response)
+        logger.debug("Returning response %d for model %s", index, model)
+        return response
 
 class MockChat:
     def __init__(self, response_dir):
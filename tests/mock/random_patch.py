@@ -62,12 +62,16 @@ class DeterministicRandom:
         Returns:
             list: List of patch objects that must be stopped later
         """
+        # The stdlib functions are swapped together with one patcher
         patches = [
-            patch('random.choice', self.choice),
-            patch('random.sample', self.sample),
-            patch('random.randint', self.randint),
-            patch('random.random', self.random),
-            patch('random.shuffle', self.shuffle),
+            patch.multiple(
+                py_random,
+                choice=self.choice,
+                sample=self.sample,
+                randint=self.randint,
+                random=self.random,
+                shuffle=self.shuffle
+            ),
             patch('numpy.random.choice', self.np_choice)
         ]
 
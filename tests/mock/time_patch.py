@@ -7,6 +7,23 @@ import sys
 original_localtime = time.localtime
 original_strftime = time.strftime
 
+class FakeDateTime(datetime.datetime):
+    """
+    datetime.datetime subclass whose now() is served by the active DeterministicTime.
+
+    Defined once at import so applying patches only has to point it at an instance.
+    Modules that imported it while patched keep the class, so outside a patch
+    window now() falls back to the real clock.
+    """
+    _instance = None
+
+    @classmethod
+    def now(cls, tz=None):
+        instance = cls._instance
+        if instance is None:
+            return super().now(tz)
+        return instance.now_func(tz)
+
 class DeterministicTime:
     """
     Provides deterministic replacements for time functions.
@@ -52,14 +69,9 @@ class DeterministicTime:
         # We'll save and restore the original to avoid affecting other tests
         self._orig_now = datetime.datetime.now
 
-        # Create a FakeDateTime class that inherits from datetime.datetime
-        # but has a modified now() classmethod
-        class FakeDateTime(datetime.datetime):
-            @classmethod
-            def now(cls, tz=None):
-                return self.now_func(tz)
-
-        # Use the backdoor to replace the original datetime
+        # Route FakeDateTime.now() to this instance and use the backdoor
+        # to replace the original datetime
+        FakeDateTime._instance = self
         datetime.datetime = FakeDateTime
 
         # Define the deterministic localtime function
@@ -99,6 +111,7 @@ class DeterministicTime:
         """Stop patches and restore original datetime"""
         # Restore original datetime
         datetime.datetime = self.orig_datetime
+        FakeDateTime._instance = None
 
         # Stop patches
         for p in patches:
@@ -29,6 +29,7 @@ def parse_args():
     parser.add_argument("--benchmark", type=str, help="Run a specific benchmark test")
     parser.add_argument("--game", type=str, help="Run a specific game test")
     parser.add_argument("--update-snapshots", action="store_true", help="Update test snapshots")
+    parser.add_argument("--fast-fail", action="store_true", help="Stop at the first failing test or assertion")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     parser.add_argument("--create", type=str, help="Create a new test (benchmark:name or game:name)")
     parser.add_argument("--models", nargs="+", default=["openai:gpt-4o", "anthropic:claude-3-7-sonnet"],
@@ -61,15 +62,20 @@ def run_tests(args):
     if args.update_snapshots:
         pytest_cmd.append("--update-snapshots")
 
+    if args.fast_fail:
+        pytest_cmd.extend(["-x", "--fast-fail"])
+
     if args.verbose:
         pytest_cmd.extend(["-v", "--log-cli-level=INFO"])
 
     if args.debug:
         pytest_cmd.extend(["--pdb", "--no-header"])
 
-    # Run the tests
+    # Run the tests unbuffered so output streams through as it's produced,
+    # even when our stdout is a pipe
     logger.info(f"Running tests with command: {' '.join(pytest_cmd)}")
-    result = subprocess.run(pytest_cmd)
+    env = {**os.environ, 'PYTHONUNBUFFERED': '1'}
+    result = subprocess.run(pytest_cmd, env=env)
 
     return result.returncode
 
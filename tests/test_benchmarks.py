@@ -1,23 +1,19 @@
 import pytest
 import os
-import yaml
 import logging
 import time
-import shutil
 from pathlib import Path
 from tests.mock.time_patch import DeterministicTime
+from core.game.config import load_yaml_file
 
 
-from tests.validation.snapshot import compare_with_snapshot, update_snapshot
+from tests.validation.snapshot import compare_with_snapshot, remove_tree, update_snapshot
 from tests.validation.assertions import validate_assertions
-import core.game.handlers.common  # Import handlers to ensure they are registered
-import core.game.handlers.creative_competition  # Import handlers to ensure they are registered
-import core.game.handlers.debate_competition  # Import handlers to ensure they are registered
 
 
 logger = logging.getLogger("BenchmarkTest")
 
-def test_benchmark(mock_llm, deterministic_environment, update_snapshots):
+def test_benchmark(mock_llm, deterministic_environment, update_snapshots, fast_fail):
     """
     Run a benchmark test with mock LLM responses and deterministic environment.
 
@@ -28,20 +24,23 @@ def test_benchmark(mock_llm, deterministic_environment, update_snapshots):
         mock_llm: Mock LLM client (fixture)
         deterministic_environment: Deterministic environment (fixture)
         update_snapshots: Flag to update snapshots instead of comparing (fixture)
+        fast_fail: Flag to stop validation at the first failed assertion (fixture)
     """
     # Get the test configuration from the mock_llm
     config_path = mock_llm.test_config_path
 
     # Load the test configuration
-    with open(config_path, 'r') as f:
-        test_config = yaml.safe_load(f)
+    test_config = load_yaml_file(config_path)
 
     # Extract key paths from test configuration
     benchmark_config_path = test_config['benchmark_config']
 
-    logger.info(f"Running benchmark test with config: {benchmark_config_path}")
+    logger.info("Running benchmark test with config: %s", benchmark_config_path)
 
     # Import here to use the patched environment
+    import core.game.handlers.common  # Import handlers to ensure they are registered
+    import core.game.handlers.creative_competition  # Import handlers to ensure they are registered
+    import core.game.handlers.debate_competition  # Import handlers to ensure they are registered
     from core.benchmark.config import BenchmarkConfig
     from core.benchmark.runner import BenchmarkRunner
     from core.benchmark.multi_player_runner import MultiPlayerBenchmarkRunner
@@ -52,33 +51,33 @@ def test_benchmark(mock_llm, deterministic_environment, update_snapshots):
     # Before running the benchmark
     output_dir = benchmark_config.get_output_dir()
     if os.path.exists(output_dir):
-        shutil.rmtree(output_dir)
+        remove_tree(output_dir)
     os.makedirs(output_dir, exist_ok=True)
 
     benchmark_type = benchmark_config.config['benchmark'].get('type', 'pairwise')
-    logger.info(f"Benchmark type: {benchmark_type}")
+    logger.info("Benchmark type: %s", benchmark_type)
     runner = None
 
     if benchmark_type == 'multi_player':
         # Create multi-player benchmark runner
-        logger.info(f"Initializing multi-player benchmark runner")
+        logger.info("Initializing multi-player benchmark runner")
         runner = MultiPlayerBenchmarkRunner(benchmark_config)
 
     else:
         # Create standard pairwise benchmark runner
-        logger.info(f"Initializing pairwise benchmark runner")
+        logger.info("Initializing pairwise benchmark runner")
         runner = BenchmarkRunner(benchmark_config)
 
     # Run the benchmark
-    start_time = time.time()
+    start_time = time.perf_counter()
     runner.run_benchmark()
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
 
-    logger.info(f"Benchmark execution completed in {elapsed_time:.2f} seconds")
+    logger.info("Benchmark execution completed in %.2f seconds", elapsed_time)
 
     # Get output directory
     output_dir = benchmark_config.get_output_dir()
-    logger.info(f"Benchmark output directory: {output_dir}")
+    logger.info("Benchmark output directory: %s", output_dir)
 
     # Determine validation method
     validation_config = test_config.get('validation', {})
@@ -92,7 +91,7 @@ def test_benchmark(mock_llm, deterministic_environment, update_snapshots):
             test_config_dir = os.path.dirname(config_path)
             expected_dir = os.path.join(test_config_dir, "expected")
 
-        logger.info(f"Validating against snapshot at: {expected_dir}")
+        logger.info("Validating against snapshot at: %s", expected_dir)
 
         # Validate or update snapshot
         success, message = compare_with_snapshot(output_dir, expected_dir, update=update_snapshots)
@@ -109,10 +108,10 @@ def test_benchmark(mock_llm, deterministic_environment, update_snapshots):
         if not assertions:
             pytest.fail("No assertions specified in validation configuration")
 
-        logger.info(f"Validating with {len(assertions)} assertions")
+        logger.info("Validating with %s assertions", len(assertions))
 
         # Validate assertions
-        success, message = validate_assertions(output_dir, assertions)
+        success, message = validate_assertions(output_dir, assertions, fast_fail=fast_fail)
 
         if not success:
             pytest.fail(message)
@@ -1,18 +1,17 @@
 import pytest
 import os
-import yaml
 import logging
 import time
 from pathlib import Path
 
 from tests.validation.snapshot import compare_with_snapshot, update_snapshot
+from core.game.config import load_yaml_file
 from tests.validation.assertions import validate_assertions
-import core.game.handlers.common  # Import handlers to ensure they are registered
 
 
 logger = logging.getLogger("GameTest")
 
-def test_game(mock_llm, deterministic_environment, update_snapshots):
+def test_game(mock_llm, deterministic_environment, update_snapshots, fast_fail):
     """
     Run a single game test with mock LLM responses and deterministic environment.
 
@@ -23,13 +22,13 @@ def test_game(mock_llm, deterministic_environment, update_snapshots):
         mock_llm: Mock LLM client (fixture)
         deterministic_environment: Deterministic environment (fixture)
         update_snapshots: Flag to update snapshots instead of comparing (fixture)
+        fast_fail: Flag to stop validation at the first failed assertion (fixture)
     """
     # Get the test configuration from the mock_llm
     config_path = mock_llm.test_config_path
 
     # Load the test configuration
-    with open(config_path, 'r') as f:
-        test_config = yaml.safe_load(f)
+    test_config = load_yaml_file(config_path)
 
     # Extract key paths from test configuration
     game_config_path = test_config.get('game_config')
@@ -38,17 +37,19 @@ def test_game(mock_llm, deterministic_environment, update_snapshots):
         # If no game_config specified, use the benchmark's base_config
         if 'benchmark_config' in test_config:
             benchmark_config_path = test_config['benchmark_config']
-            with open(benchmark_config_path, 'r') as f:
-                benchmark_config = yaml.safe_load(f)
-                if 'benchmark' in benchmark_config and 'base_config' in benchmark_config['benchmark']:
-                    game_config_path = benchmark_config['benchmark']['base_config']
+            benchmark_config = load_yaml_file(benchmark_config_path)
+            if 'benchmark' in benchmark_config and 'base_config' in benchmark_config['benchmark']:
+                game_config_path = benchmark_config['benchmark']['base_config']
 
     if not game_config_path:
         pytest.fail("No game_config found in test configuration or related benchmark config")
 
-    logger.info(f"Running game test with config: {game_config_path}")
+    logger.info("Running game test with config: %s", game_config_path)
 
     # Import here to use the patched environment
+    import core.game.handlers.common  # Import handlers to ensure they are registered
+    import core.game.handlers.creative_competition  # Import handlers to ensure they are registered
+    import core.game.handlers.debate_competition  # Import handlers to ensure they are registered
     from core.game.engine import GameEngine
 
     # Set output directory
@@ -59,15 +60,15 @@ def test_game(mock_llm, deterministic_environment, update_snapshots):
     engine = GameEngine(game_config_path, base_output_dir=output_dir)
 
     # Run the game
-    start_time = time.time()
+    start_time = time.perf_counter()
     engine.run_game()
-    elapsed_time = time.time() - start_time
+    elapsed_time = time.perf_counter() - start_time
 
-    logger.info(f"Game execution completed in {elapsed_time:.2f} seconds")
+    logger.info("Game execution completed in %.2f seconds", elapsed_time)
 
     # Get session directory
     session_dir = engine.game_session.session_dir
-    logger.info(f"Game session directory: {session_dir}")
+    logger.info("Game session directory: %s", session_dir)
 
     # Determine validation method
     validation_config = test_config.get('validation', {})
@@ -81,7 +82,7 @@ def test_game(mock_llm, deterministic_environment, update_snapshots):
             test_config_dir = os.path.dirname(config_path)
             expected_dir = os.path.join(test_config_dir, "expected_game")
 
-        logger.info(f"Validating against snapshot at: {expected_dir}")
+        logger.info("Validating against snapshot at: %s", expected_dir)
 
         # Validate or update snapshot
         success, message = compare_with_snapshot(session_dir, expected_dir, update=update_snapshots)
@@ -98,10 +99,10 @@ def test_game(mock_llm, deterministic_environment, update_snapshots):
         if not assertions:
             pytest.fail("No assertions specified in validation configuration")
 
-        logger.info(f"Validating with {len(assertions)} assertions")
+        logger.info("Validating with %s assertions", len(assertions))
 
         # For single games, validate assertions on the session directory
-        success, message = validate_assertions(session_dir, assertions)
+        success, message = validate_assertions(session_dir, assertions, fast_fail=fast_fail)
 
         if not success:
             pytest.fail(message)
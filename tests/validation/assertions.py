@@ -1,11 +1,38 @@
 import os
-import glob
 import json
 import logging
 import re
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import NamedTuple
+
+from tests.validation.snapshot import json_loads, list_session_dirs
 
 logger = logging.getLogger("AssertionValidation")
 
+class AssertionResult(NamedTuple):
+    """Outcome of evaluating a single assertion."""
+    success: bool
+    assertion: str
+    message: str
+
+def _read_results(session_dir):
+    """
+    Read a session's results.json.
+
+    Args:
+        session_dir (str): Session directory
+
+    Returns:
+        dict: Parsed results, or None if the file is missing or not valid JSON
+    """
+    try:
+        with open(os.path.join(session_dir, "results.json"), 'rb') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
 def extract_benchmark_data(output_dir):
     """
     Extract essential data from benchmark results for assertion checking.
@@ -20,7 +47,7 @@ def extract_benchmark_data(output_dir):
         'games_completed': 0,
         'player_scores': {},
         'winners': [],
-        'player_counts': {},
+        'player_counts': Counter(),
         'session_data': [],
         'model_outcomes': {}
     }
@@ -32,19 +59,27 @@ def extract_benchmark_data(output_dir):
         return data
 
     try:
-        # Parse benchmark log
+        # Parse benchmark log from a single binary read; json_loads is orjson when available
+        with open(benchmark_log_path, 'rb') as f:
+            raw = f.read()
+
         entries = []
-        with open(benchmark_log_path, 'r') as f:
-            for line in f:
-                try:
-                    entry = json.loads(line.strip())
-                    entries.append(entry)
-                except json.JSONDecodeError:
-                    continue
+        for line in raw.split(b'\n'):
+            if not line.strip():
+                continue
+            try:
+                entries.append(json_loads(line))
+            except json.JSONDecodeError:
+                continue
 
         # Count games completed
         data['games_completed'] = len(entries)
 
+        # Bind the aggregates locally for the per-entry loop
+        winners = data['winners']
+        player_scores = data['player_scores']
+        model_outcomes = defaultdict(lambda: {'wins': 0, 'losses': 0, 'ties': 0, 'total_games': 0})
+
         # Process each entry
         for entry in entries:
             # Track winners
@@ -52,70 +87,65 @@ def extract_benchmark_data(output_dir):
             if winner_id:
                 if isinstance(winner_id, dict):
                     winner_id = winner_id.get('id', 'unknown')
-                data['winners'].append(winner_id)
+                winners.append(winner_id)
 
-            # Track player scores
-            players = entry.get('players', [])
-            for player in players:
-                player_id = player.get('id', 'unknown')
+            # Track player scores as running [total, count] pairs
+            for player in entry.get('players', []):
                 score = player.get('score')
-
                 if score is not None:
-                    if player_id not in data['player_scores']:
-                        data['player_scores'][player_id] = []
-                    data['player_scores'][player_id].append(score)
+                    player_id = player.get('id', 'unknown')
+                    totals = player_scores.get(player_id)
+                    if totals is None:
+                        player_scores[player_id] = [score, 1]
+                    else:
+                        totals[0] += score
+                        totals[1] += 1
 
             # Track model outcomes
             if 'player1' in entry and 'player2' in entry:
                 # For pairwise benchmarks
-                model1 = entry.get('player1', {}).get('model', 'unknown')
-                model2 = entry.get('player2', {}).get('model', 'unknown')
-
-                # Initialize model stats if not present
-                for model in [model1, model2]:
-                    if model not in data['model_outcomes']:
-                        data['model_outcomes'][model] = {
-                            'wins': 0,
-                            'losses': 0,
-                            'ties': 0,
-                            'total_games': 0
-                        }
+                stats1 = model_outcomes[entry.get('player1', {}).get('model', 'unknown')]
+                stats2 = model_outcomes[entry.get('player2', {}).get('model', 'unknown')]
 
                 # Track outcome
                 if winner_id == 'player_1':
-                    data['model_outcomes'][model1]['wins'] += 1
-                    data['model_outcomes'][model2]['losses'] += 1
+                    stats1['wins'] += 1
+                    stats2['losses'] += 1
                 elif winner_id == 'player_2':
-                    data['model_outcomes'][model1]['losses'] += 1
-                    data['model_outcomes'][model2]['wins'] += 1
+                    stats1['losses'] += 1
+                    stats2['wins'] += 1
                 else:
-                    data['model_outcomes'][model1]['ties'] += 1
-                    data['model_outcomes'][model2]['ties'] += 1
-
-                data['model_outcomes'][model1]['total_games'] += 1
-                data['model_outcomes'][model2]['total_games'] += 1
-
-        # Get session data
-        session_dirs = [d for d in glob.glob(f"{output_dir}/*")
-                        if os.path.isdir(d) and not d.endswith("expected")]
-
-        for session_dir in session_dirs:
-            results_path = os.path.join(session_dir, "results.json")
-            if os.path.exists(results_path):
-                try:
-                    with open(results_path, 'r') as f:
-                        results = json.load(f)
-                        data['session_data'].append(results)
-
-                        # Count players
-                        player_count = len(results.get('players', []))
-                        data['player_counts'][player_count] = data['player_counts'].get(player_count, 0) + 1
-                except json.JSONDecodeError:
-                    continue
+                    stats1['ties'] += 1
+                    stats2['ties'] += 1
+
+                stats1['total_games'] += 1
+                stats2['total_games'] += 1
+
+        # Expose model outcomes as a plain dict so missing models fail loudly in assertions
+        data['model_outcomes'] = dict(model_outcomes)
+
+        # Get session data; the reads are independent, so overlap them when there are several
+        session_dirs = list_session_dirs(output_dir)
+        if len(session_dirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(32, len(session_dirs))) as executor:
+                session_results = list(executor.map(_read_results, session_dirs))
+        else:
+            session_results = [_read_results(session_dir) for session_dir in session_dirs]
+
+        for results in session_results:
+            if results is not None:
+                data['session_data'].append(results)
+
+                # Count players
+                player_count = len(results.get('players', []))
+                data['player_counts'][player_count] += 1
+
+        # Expose player counts as a plain dict so missing counts fail loudly in assertions
+        data['player_counts'] = dict(data['player_counts'])
 
         # Calculate average scores
-        for player_id, scores in data['player_scores'].items():
-            data['player_scores'][player_id] = sum(scores) / len(scores) if scores else 0
+        for player_id, (total, count) in data['player_scores'].items():
+            data['player_scores'][player_id] = total / count
 
         return data
 
@@ -123,6 +153,14 @@ def extract_benchmark_data(output_dir):
         logger.error(f"Error extracting benchmark data: {str(e)}")
         return data
 
+# Functions assertions may call, e.g. len(winners) > 0
+ASSERTION_FUNCTIONS = {'len': len, 'sum': sum, 'min': min, 'max': max, 'all': all, 'any': any}
+
+@lru_cache(maxsize=256)
+def _compile_assertion(assertion):
+    """Compile an assertion string once; later evaluations reuse the code object."""
+    return compile(assertion, '<assertion>', 'eval')
+
 def evaluate_assertion(assertion, data):
     """
     Evaluate an assertion against benchmark data.
@@ -132,7 +170,7 @@ def evaluate_assertion(assertion, data):
         data (dict): Benchmark data
 
     Returns:
-        tuple: (bool, str) - Success flag and error message
+        AssertionResult: Success flag, the assertion and a description of the outcome
     """
     # Create a safe environment with only the data variables
     env = {
@@ -145,23 +183,24 @@ def evaluate_assertion(assertion, data):
 
     try:
         # Evaluate the assertion
-        result = eval(assertion, {"__builtins__": {}}, env)
+        result = eval(_compile_assertion(assertion), {"__builtins__": {}, **ASSERTION_FUNCTIONS}, env)
 
         if bool(result):
-            return True, f"Assertion passed: {assertion}"
+            return AssertionResult(True, assertion, f"Assertion passed: {assertion}")
         else:
-            return False, f"Assertion failed: {assertion}"
+            return AssertionResult(False, assertion, f"Assertion failed: {assertion}")
 
     except Exception as e:
-        return False, f"Error evaluating assertion '{assertion}': {str(e)}"
+        return AssertionResult(False, assertion, f"Error evaluating assertion '{assertion}': {str(e)}")
 
-def validate_assertions(output_dir, assertions):
+def validate_assertions(output_dir, assertions, fast_fail=False):
     """
     Validate benchmark results against a list of assertions.
 
     Args:
         output_dir (str): Directory containing benchmark results
         assertions (list): List of assertion strings
+        fast_fail (bool): Stop evaluating at the first failed assertion
 
     Returns:
         tuple: (bool, str) - Overall success flag and error messages
@@ -172,16 +211,16 @@ def validate_assertions(output_dir, assertions):
     # Validate each assertion
     results = []
     for assertion in assertions:
-        success, message = evaluate_assertion(assertion, data)
-        results.append((success, message))
+        result = evaluate_assertion(assertion, data)
+        results.append(result)
+        if fast_fail and not result.success:
+            break
 
-    # Check if all assertions passed
-    all_passed = all(success for success, _ in results)
+    # Collect failed assertions
+    failed_messages = [result.message for result in results if not result.success]
 
     # Summarize results
-    if all_passed:
+    if not failed_messages:
         return True, "All assertions passed"
     else:
-        # Collect failed assertion messages
-        failed_messages = [message for success, message in results if not success]
         return False, "Assertion failures:\n" + "\n".join(failed_messages)
\ No newline at end of file
@@ -1,17 +1,210 @@
 import os
-import glob
 import json
 import shutil
 import logging
 import difflib
+import filecmp
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, zip_longest
 from pathlib import Path
+from typing import NamedTuple
+
+try:
+    import orjson
+    json_loads = orjson.loads
+
+    def dumps_sorted(obj):
+        """Serialize with sorted keys for diff output."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS).decode()
+except ImportError:
+    json_loads = json.loads
+
+    def dumps_sorted(obj):
+        """Serialize with sorted keys for diff output."""
+        return json.dumps(obj, sort_keys=True)
 
 logger = logging.getLogger("SnapshotValidation")
 
+# Read actual and expected files concurrently (useful on networked CI storage)
+PARALLEL_READ = os.environ.get("SNAPSHOT_PARALLEL_READ", "").lower() in ("1", "true", "yes")
+
+# Keys whose values are always replaced during normalization
+NORMALIZED_KEYS = {
+    'timestamp': "NORMALIZED_TIMESTAMP",
+    'created_at': "NORMALIZED_TIMESTAMP",
+    'modified_at': "NORMALIZED_TIMESTAMP",
+    # session_id contains timestamps
+    'session_id': "NORMALIZED_SESSION_ID",
+}
+
+# Keys holding directories with timestamps, replaced when the value is a string
+DIRECTORY_KEYS = frozenset(('session_dir', 'output_dir'))
+
+# Serialized key fragments that normalization can act on; '_id"' covers UUID fields
+VOLATILE_MARKERS = tuple(f'"{key}"' for key in (*NORMALIZED_KEYS, *DIRECTORY_KEYS)) + ('_id"',)
+
+def needs_normalization(text):
+    """
+    Check whether serialized JSON contains any key that normalize_json rewrites.
+
+    Args:
+        text (str): Serialized JSON
+
+    Returns:
+        bool: False if normalizing the parsed text would leave it unchanged
+    """
+    return any(marker in text for marker in VOLATILE_MARKERS)
+
+class SessionPaths(NamedTuple):
+    """Paths to the output files of a single game session."""
+    results_json: str
+    snapshots_jsonl: str
+
+    @classmethod
+    def for_session(cls, session_dir):
+        """
+        Build the output file paths for a session directory.
+
+        Args:
+            session_dir (str): Path to the session directory
+
+        Returns:
+            SessionPaths: Paths to the session's output files
+        """
+        return cls(
+            results_json=os.path.join(session_dir, "results.json"),
+            snapshots_jsonl=os.path.join(session_dir, "snapshots.jsonl"),
+        )
+
+def list_file_names(directory):
+    """
+    List the names of the regular files in a directory with one directory read.
+
+    Args:
+        directory (str): Directory to list
+
+    Returns:
+        set: File names in the directory
+    """
+    with os.scandir(directory) as it:
+        return {entry.name for entry in it if entry.is_file()}
+
+def list_session_dirs(parent_dir):
+    """
+    List the session directories under a benchmark output directory.
+
+    Session directories are named by timestamp, so sorting by name orders
+    them chronologically without a stat call per entry.
+
+    Args:
+        parent_dir (str): Directory containing session directories
+
+    Returns:
+        list: Sorted session directory paths, excluding 'expected' snapshot directories
+    """
+    with os.scandir(parent_dir) as it:
+        return sorted(entry.path for entry in it
+                      if entry.is_dir() and not entry.name.startswith('.')
+                      and not entry.name.endswith("expected"))
+
+def remove_tree(path):
+    """
+    Recursively delete a directory tree.
+
+    Where shutil.rmtree works relative to open directory descriptors
+    (unlinkat, as on Linux) it is used directly. Otherwise the tree is walked
+    with os.scandir, using each entry's cached file type so no extra stat call
+    is made per file before unlinking it.
+
+    Args:
+        path (str): Directory to remove
+    """
+    if shutil.rmtree.avoids_symlink_attacks:
+        shutil.rmtree(path)
+        return
+
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                remove_tree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def files_identical(actual_file, expected_file):
+    """
+    Check whether two files are byte-for-byte identical.
+
+    Sizes are compared first so differing files are usually rejected
+    without reading them; equal-sized files are compared byte by byte,
+    stopping at the first difference.
+
+    Args:
+        actual_file (str): Path to actual file
+        expected_file (str): Path to expected file
+
+    Returns:
+        bool: True if both files have identical contents
+    """
+    if os.stat(actual_file).st_size != os.stat(expected_file).st_size:
+        return False
+    return filecmp.cmp(actual_file, expected_file, shallow=False)
+
+def install_snapshot(actual_dir, expected_dir):
+    """
+    Copy actual results into place as the expected snapshot.
+
+    The copy is staged in a sibling directory and moved over the old snapshot
+    only once complete, so a failed copy never leaves a partial snapshot.
+    Files are copied rather than hard-linked: game sessions append to their
+    logs, and a shared inode would let a later run rewrite the snapshot.
+
+    Args:
+        actual_dir (str): Directory containing actual results
+        expected_dir (str): Directory where expected snapshots should be stored
+    """
+    staging_dir = f"{expected_dir.rstrip(os.sep)}.staging"
+    if os.path.exists(staging_dir):
+        remove_tree(staging_dir)
+
+    shutil.copytree(actual_dir, staging_dir)
+
+    # Remove existing directory if it exists, then move the staged copy in
+    if os.path.exists(expected_dir):
+        remove_tree(expected_dir)
+    os.replace(staging_dir, expected_dir)
+
+def _read_file(path):
+    """Read a text file in full."""
+    with open(path, 'r') as f:
+        return f.read()
+
+def read_file_pair(actual_file, expected_file):
+    """
+    Read an actual/expected file pair, concurrently if PARALLEL_READ is set.
+
+    Args:
+        actual_file (str): Path to actual file
+        expected_file (str): Path to expected file
+
+    Returns:
+        tuple: (str, str) - Contents of the actual and expected files
+    """
+    if not PARALLEL_READ:
+        return _read_file(actual_file), _read_file(expected_file)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        actual_future = executor.submit(_read_file, actual_file)
+        expected_future = executor.submit(_read_file, expected_file)
+        return actual_future.result(), expected_future.result()
+
 def normalize_json(json_obj):
     """
     Normalize timestamps and other variable data in JSON objects.
 
+    Nested values are dispatched on their exact type, which is all parsed
+    JSON contains; only the top-level object may be a dict or list subclass.
+
     Args:
         json_obj: JSON object (dict, list, etc.)
 
@@ -19,28 +212,93 @@ def normalize_json(json_obj):
         JSON object with normalized values
     """
     if isinstance(json_obj, dict):
-        normalized = {}
-        for key, value in json_obj.items():
-            # Normalize timestamp fields
-            if key in ('timestamp', 'created_at', 'modified_at'):
-                normalized[key] = "NORMALIZED_TIMESTAMP"
-            # Skip session_id which contains timestamps
-            elif key == 'session_id':
-                normalized[key] = "NORMALIZED_SESSION_ID"
-            # UUID fields
-            elif key.endswith('_id') and isinstance(value, str) and '-' in value and len(value) > 30:
-                normalized[key] = "NORMALIZED_UUID"
-            # Directories with timestamps
-            elif key in ('session_dir', 'output_dir') and isinstance(value, str):
-                normalized[key] = "NORMALIZED_DIRECTORY"
-            else:
-                normalized[key] = normalize_json(value)
-        return normalized
+        root = {}
     elif isinstance(json_obj, list):
-        return [normalize_json(item) for item in json_obj]
+        root = []
     else:
         return json_obj
 
+    # Walk the tree with an explicit stack; each container's copy is linked
+    # into its parent before being filled, so key and item order is kept
+    stack = [(json_obj, root)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        source, normalized = pop()
+
+        if type(normalized) is dict:
+            for key, value in source.items():
+                # Timestamp and session ID fields, one lookup for every key
+                replacement = NORMALIZED_KEYS.get(key)
+                if replacement is not None:
+                    normalized[key] = replacement
+                    continue
+
+                kind = type(value)
+                if kind is str:
+                    # UUID fields
+                    if key.endswith('_id') and '-' in value and len(value) > 30:
+                        normalized[key] = "NORMALIZED_UUID"
+                    # Directories with timestamps
+                    elif key in DIRECTORY_KEYS:
+                        normalized[key] = "NORMALIZED_DIRECTORY"
+                    else:
+                        normalized[key] = value
+                elif kind is dict or kind is list:
+                    normalized[key] = child = kind()
+                    push((value, child))
+                else:
+                    normalized[key] = value
+        else:
+            for item in source:
+                kind = type(item)
+                if kind is dict or kind is list:
+                    child = kind()
+                    push((item, child))
+                else:
+                    child = item
+                normalized.append(child)
+
+    return root
+
+def _short_repr(value, limit=120):
+    """Serialize a value for a difference report, truncated to a readable length."""
+    text = dumps_sorted(value)
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def iter_differences(expected, actual, path=""):
+    """
+    Yield a description of each differing path between two JSON structures.
+
+    Containers of the same type are compared key by key or item by item, so
+    iteration can stop at the first few differences without a full text diff.
+
+    Args:
+        expected: Expected JSON value
+        actual: Actual JSON value
+        path (str): Path of the values within the document
+
+    Yields:
+        str: One line per difference, e.g. "players[1].score: expected 4, actual 5"
+    """
+    if type(expected) is dict and type(actual) is dict:
+        for key, expected_value in expected.items():
+            key_path = f"{path}.{key}" if path else str(key)
+            if key not in actual:
+                yield f"{key_path}: missing from actual"
+            else:
+                yield from iter_differences(expected_value, actual[key], key_path)
+        for key in actual:
+            if key not in expected:
+                yield f"{f'{path}.{key}' if path else key}: not expected"
+    elif type(expected) is list and type(actual) is list:
+        for i, (expected_item, actual_item) in enumerate(zip(expected, actual)):
+            yield from iter_differences(expected_item, actual_item, f"{path}[{i}]")
+        if len(expected) != len(actual):
+            yield f"{path or '<root>'}: expected {len(expected)} items, actual {len(actual)}"
+    elif expected != actual:
+        yield f"{path or '<root>'}: expected {_short_repr(expected)}, actual {_short_repr(actual)}"
+
 def compare_json_files(actual_file, expected_file):
     """
     Compare two JSON files, normalizing variable data.
@@ -52,48 +310,47 @@ def compare_json_files(actual_file, expected_file):
     Returns:
         tuple: (bool, str) - Is match, difference description
     """
-    if not os.path.exists(actual_file):
-        return False, f"Actual file does not exist: {actual_file}"
+    try:
+        # Identical files match without parsing or normalizing
+        if files_identical(actual_file, expected_file):
+            return True, "Files match exactly"
 
-    if not os.path.exists(expected_file):
-        return False, f"Expected file does not exist: {expected_file}"
+        actual_text, expected_text = read_file_pair(actual_file, expected_file)
+        actual_json = json_loads(actual_text)
+        expected_json = json_loads(expected_text)
 
-    try:
-        with open(actual_file, 'r') as f1, open(expected_file, 'r') as f2:
-            actual_json = json.load(f1)
-            expected_json = json.load(f2)
-
-            # Normalize variable data
-            actual_normalized = normalize_json(actual_json)
-            expected_normalized = normalize_json(expected_json)
-
-            # Convert to string with consistent formatting
-            actual_str = json.dumps(actual_normalized, sort_keys=True, indent=2)
-            expected_str = json.dumps(expected_normalized, sort_keys=True, indent=2)
-
-            # Check for exact match
-            if actual_str == expected_str:
-                return True, "Files match exactly"
-
-            # Generate diff for reporting
-            diff = difflib.unified_diff(
-                expected_str.splitlines(),
-                actual_str.splitlines(),
-                fromfile="expected",
-                tofile="actual",
-                lineterm=""
-            )
-            diff_str = "\n".join(list(diff)[:20])  # Limit diff size
-            if len(list(diff)) > 20:
-                diff_str += "\n... (diff truncated) ..."
-
-            return False, diff_str
+        # Normalize variable data, skipping documents without volatile keys
+        actual_normalized = normalize_json(actual_json) if needs_normalization(actual_text) else actual_json
+        expected_normalized = normalize_json(expected_json) if needs_normalization(expected_text) else expected_json
+
+        # Compare structurally; only serialize when a diff has to be reported
+        if actual_normalized == expected_normalized:
+            return True, "Files match exactly"
+
+        # Report the first differing paths, walking only as far as needed
+        diff_lines = list(islice(iter_differences(expected_normalized, actual_normalized), 21))
+        diff_str = "\n".join(diff_lines[:20])  # Limit diff size
+        if len(diff_lines) > 20:
+            diff_str += "\n... (diff truncated) ..."
 
+        return False, diff_str
+
+    except FileNotFoundError as e:
+        label = "Actual" if e.filename == actual_file else "Expected"
+        return False, f"{label} file does not exist: {e.filename}"
     except json.JSONDecodeError as e:
         return False, f"JSON parsing error: {str(e)}"
     except Exception as e:
         return False, f"Comparison failed: {str(e)}"
 
+def _normalize_jsonl_line(line):
+    """Parse and normalize one JSONL line, keeping unparseable lines as stripped text."""
+    try:
+        parsed = json_loads(line)
+    except json.JSONDecodeError:
+        return line.strip()
+    return normalize_json(parsed) if needs_normalization(line) else parsed
+
 def compare_jsonl_files(actual_file, expected_file):
     """
     Compare two JSONL files, normalizing variable data.
@@ -105,40 +362,30 @@ def compare_jsonl_files(actual_file, expected_file):
     Returns:
         tuple: (bool, str) - Is match, difference description
     """
-    if not os.path.exists(actual_file):
-        return False, f"Actual file does not exist: {actual_file}"
-
-    if not os.path.exists(expected_file):
-        return False, f"Expected file does not exist: {expected_file}"
-
     try:
-        # Load both files into lists of normalized JSON objects
-        actual_lines = []
-        with open(actual_file, 'r') as f:
-            for line in f:
-                try:
-                    actual_lines.append(normalize_json(json.loads(line)))
-                except json.JSONDecodeError:
-                    actual_lines.append(line.strip())
-
-        expected_lines = []
-        with open(expected_file, 'r') as f:
-            for line in f:
-                try:
-                    expected_lines.append(normalize_json(json.loads(line)))
-                except json.JSONDecodeError:
-                    expected_lines.append(line.strip())
-
-        # Check line count first
-        if len(actual_lines) != len(expected_lines):
-            return False, f"Line count mismatch: actual={len(actual_lines)}, expected={len(expected_lines)}"
-
-        # Compare each line
-        for i, (actual, expected) in enumerate(zip(actual_lines, expected_lines)):
-            if actual != expected:
+        # Identical files match without parsing or normalizing
+        if files_identical(actual_file, expected_file):
+            return True, "Files match exactly"
+
+        # Walk both files in lockstep, normalizing one line at a time
+        with open(actual_file, 'r') as actual_f, open(expected_file, 'r') as expected_f:
+            for i, (actual_line, expected_line) in enumerate(zip_longest(actual_f, expected_f)):
+                if actual_line is not None and expected_line is not None:
+                    actual = _normalize_jsonl_line(actual_line)
+                    expected = _normalize_jsonl_line(expected_line)
+                    if actual == expected:
+                        continue
+
+                # A line count mismatch takes precedence over content differences,
+                # so count the rest of both files before reporting
+                actual_count = i + (actual_line is not None) + sum(1 for _ in actual_f)
+                expected_count = i + (expected_line is not None) + sum(1 for _ in expected_f)
+                if actual_count != expected_count:
+                    return False, f"Line count mismatch: actual={actual_count}, expected={expected_count}"
+
                 # Convert to string for detailed diff
-                actual_str = json.dumps(actual, sort_keys=True)
-                expected_str = json.dumps(expected, sort_keys=True)
+                actual_str = dumps_sorted(actual)
+                expected_str = dumps_sorted(expected)
 
                 diff = difflib.unified_diff(
                     expected_str.splitlines(),
@@ -153,6 +400,9 @@ def compare_jsonl_files(actual_file, expected_file):
         # All lines match
         return True, "Files match exactly"
 
+    except FileNotFoundError as e:
+        label = "Actual" if e.filename == actual_file else "Expected"
+        return False, f"{label} file does not exist: {e.filename}"
     except Exception as e:
         return False, f"Comparison failed: {str(e)}"
 
@@ -184,12 +434,8 @@ def compare_with_snapshot(actual_dir, expected_dir, update=False):
         except Exception as e:
             logger.error(f"SNAPSHOT DEBUG - Failed to create parent directory: {str(e)}")
         
-        # Remove existing directory if it exists
-        if os.path.exists(expected_dir):
-            shutil.rmtree(expected_dir)
-
         # Copy all contents
-        shutil.copytree(actual_dir, expected_dir)
+        install_snapshot(actual_dir, expected_dir)
         logger.info(f"Updated snapshot at {expected_dir}")
         return True, f"Snapshot updated at {expected_dir}"
 
@@ -197,11 +443,15 @@ def compare_with_snapshot(actual_dir, expected_dir, update=False):
     if not os.path.exists(expected_dir):
         return False, f"Expected output directory not found: {expected_dir}"
 
+    # List each directory once instead of probing every file separately
+    actual_files = list_file_names(actual_dir)
+    expected_files = list_file_names(expected_dir)
+
     # Compare benchmark log
     bench_log = os.path.join(actual_dir, "benchmark_log.jsonl")
     expected_bench_log = os.path.join(expected_dir, "benchmark_log.jsonl")
 
-    if os.path.exists(bench_log) and os.path.exists(expected_bench_log):
+    if "benchmark_log.jsonl" in actual_files and "benchmark_log.jsonl" in expected_files:
         log_match, log_diff = compare_jsonl_files(bench_log, expected_bench_log)
         if not log_match:
             return False, f"Benchmark log mismatch:\n{log_diff}"
@@ -210,42 +460,35 @@ def compare_with_snapshot(actual_dir, expected_dir, update=False):
     bench_state = os.path.join(actual_dir, "benchmark_state.json")
     expected_bench_state = os.path.join(expected_dir, "benchmark_state.json")
 
-    if os.path.exists(bench_state) and os.path.exists(expected_bench_state):
+    if "benchmark_state.json" in actual_files and "benchmark_state.json" in expected_files:
         state_match, state_diff = compare_json_files(bench_state, expected_bench_state)
         if not state_match:
             return False, f"Benchmark state mismatch:\n{state_diff}"
 
-    # Get session directories
-    actual_sessions = [d for d in glob.glob(f"{actual_dir}/*")
-                      if os.path.isdir(d) and not d.endswith("expected")]
-    expected_sessions = [d for d in glob.glob(f"{expected_dir}/*")
-                        if os.path.isdir(d) and not d.endswith("expected")]
+    # Get session directories, sorted to ensure consistent comparison
+    actual_sessions = list_session_dirs(actual_dir)
+    expected_sessions = list_session_dirs(expected_dir)
 
     # We don't care about matching session IDs, but we want to match counts
     if len(actual_sessions) != len(expected_sessions):
         return False, f"Session count mismatch: actual={len(actual_sessions)}, expected={len(expected_sessions)}"
 
-    # Sort sessions to ensure consistent comparison
-    actual_sessions.sort()
-    expected_sessions.sort()
-
     # Compare each session's results
     for i, (actual_session, expected_session) in enumerate(zip(actual_sessions, expected_sessions)):
-        # Compare results.json
-        actual_results = os.path.join(actual_session, "results.json")
-        expected_results = os.path.join(expected_session, "results.json")
+        actual_paths = SessionPaths.for_session(actual_session)
+        expected_paths = SessionPaths.for_session(expected_session)
+        actual_files = list_file_names(actual_session)
+        expected_files = list_file_names(expected_session)
 
-        if os.path.exists(actual_results) and os.path.exists(expected_results):
-            results_match, results_diff = compare_json_files(actual_results, expected_results)
+        # Compare results.json
+        if "results.json" in actual_files and "results.json" in expected_files:
+            results_match, results_diff = compare_json_files(actual_paths.results_json, expected_paths.results_json)
             if not results_match:
                 return False, f"Results mismatch in session {i+1}:\n{results_diff}"
 
         # Compare snapshots.jsonl (if present)
-        actual_snapshots = os.path.join(actual_session, "snapshots.jsonl")
-        expected_snapshots = os.path.join(expected_session, "snapshots.jsonl")
-
-        if os.path.exists(actual_snapshots) and os.path.exists(expected_snapshots):
-            snapshots_match, snapshots_diff = compare_jsonl_files(actual_snapshots, expected_snapshots)
+        if "snapshots.jsonl" in actual_files and "snapshots.jsonl" in expected_files:
+            snapshots_match, snapshots_diff = compare_jsonl_files(actual_paths.snapshots_jsonl, expected_paths.snapshots_jsonl)
             if not snapshots_match:
                 return False, f"Snapshots mismatch in session {i+1}:\n{snapshots_diff}"
 
@@ -267,12 +510,8 @@ def update_snapshot(actual_dir, expected_dir):
         # Ensure parent directory exists
         os.makedirs(os.path.dirname(expected_dir), exist_ok=True)
 
-        # Remove existing directory if it exists
-        if os.path.exists(expected_dir):
-            shutil.rmtree(expected_dir)
-
         # Copy all contents
-        shutil.copytree(actual_dir, expected_dir)
+        install_snapshot(actual_dir, expected_dir)
         logger.info(f"Updated snapshot at {expected_dir}")
         return True
     except Exception as e: